@@ -16,45 +16,126 @@ Works on Windows 10 and 11. Does NOT require admin for basic info.
 Some features (temps, SMART health, detailed power) may need elevated access.
 """
 
-import argparse
 import json
 import logging
 import os
 import platform
 import re
+import struct
 import subprocess
 import sys
+import threading
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 
 # ---------------------------------------------------------------------------
-# Safe imports — every optional library is wrapped so the scanner never crashes
+# Safe imports — every optional library is loaded on first use and wrapped so
+# the scanner never crashes (and --help / library import stay fast)
 # ---------------------------------------------------------------------------
 
-try:
-    import psutil
-except ImportError:
-    psutil = None
-    print("[WARN] psutil not installed — some system info will be unavailable.")
+@lru_cache(maxsize=1)
+def _get_psutil():
+    """Return the psutil module, or None if it is not installed."""
+    try:
+        import psutil
+    except ImportError:
+        print("[WARN] psutil not installed — some system info will be unavailable.")
+        return None
+    # Prime the per-core counters: scan_cpu() reads them again with no
+    # interval, measuring usage across the scan instead of sleeping for it.
+    psutil.cpu_percent(percpu=True)
+    return psutil
 
-try:
-    import GPUtil
-except ImportError:
-    GPUtil = None
 
-try:
-    import wmi as wmi_module
+@lru_cache(maxsize=1)
+def _get_gputil():
+    """Return the GPUtil module, or None."""
+    try:
+        import GPUtil
+    except ImportError:
+        return None
+    return GPUtil
 
-    _WMI_AVAILABLE = True
-except ImportError:
-    wmi_module = None
-    _WMI_AVAILABLE = False
 
+@lru_cache(maxsize=1)
+def _get_wmi_module():
+    """Return the wmi module (pulls in pywin32 / pythoncom), or None."""
+    try:
+        # Join COM's multithreaded apartment (pythoncom reads this flag when it is
+        # first imported) so WMI connections can be shared by the scan threads.
+        sys.coinit_flags = 0  # COINIT_MULTITHREADED
+        import wmi
+    except ImportError:
+        return None
+    return wmi
+
+
+@lru_cache(maxsize=1)
+def _get_nvml():
+    """Return pynvml (nvidia-ml-py) with NVML initialised, or None.
+
+    NVML is initialised once per process and shut down at exit; None also
+    covers machines without an NVIDIA driver.
+    """
+    import atexit
+
+    try:
+        import pynvml
+
+        pynvml.nvmlInit()
+    except Exception:
+        return None
+    atexit.register(pynvml.nvmlShutdown)
+    return pynvml
+
+
+@lru_cache(maxsize=1)
+def _get_cpuinfo():
+    """Return the py-cpuinfo module, or None."""
+    try:
+        import cpuinfo
+    except ImportError:
+        return None
+    return cpuinfo
+
+
+@lru_cache(maxsize=1)
+def _get_iphlpapi():
+    """Return iphlpapi.dll with the ICMP echo prototypes set up, or None off Windows."""
+    try:
+        import ctypes
+
+        lib = ctypes.windll.iphlpapi
+    except (ImportError, AttributeError, OSError):
+        return None
+    lib.IcmpCreateFile.restype = ctypes.c_void_p
+    lib.IcmpSendEcho.argtypes = [
+        ctypes.c_void_p, ctypes.c_ulong, ctypes.c_char_p, ctypes.c_ushort,
+        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong, ctypes.c_ulong,
+    ]
+    lib.IcmpSendEcho.restype = ctypes.c_ulong
+    lib.IcmpCloseHandle.argtypes = [ctypes.c_void_p]
+    return lib
+
+
+# orjson is a cheap import and used on every scan, so it is bound eagerly.
 try:
-    import cpuinfo as cpuinfo_module
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
 except ImportError:
-    cpuinfo_module = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -82,148 +163,769 @@ def _bytes_to_gb(b, decimals=2):
     return round(b / (1024 ** 3), decimals)
 
 
+@lru_cache(maxsize=1)
+def _platform_info() -> MappingProxyType:
+    """platform.* values, read once per process (version() can spawn `ver`)."""
+    return MappingProxyType({
+        "version": platform.version(),
+        "release": platform.release(),
+        "edition": platform.win32_edition() if hasattr(platform, "win32_edition") else "",
+        "machine": platform.machine(),
+    })
+
+
+# Patterns and lookup tables shared across scans — built once at import.
+_CACHE_RE = re.compile(r"([\d.]+)\s*(KB|MB|GB|B)?", re.IGNORECASE)
+_CACHE_MULT_KB = {"B": 1 / 1024, "KB": 1, "MB": 1024, "GB": 1024 ** 2}
+_GHZ_RE = re.compile(r"([\d.]+)\s*GHz", re.IGNORECASE)
+_WMI_DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})")  # 20230101000000.000000+000
+_POWER_PLAN_RE = re.compile(r"\((.+)\)")  # powercfg: "Power Scheme GUID: ... (Plan Name)"
+_PING_AVG_RE = re.compile(r"Average\s*=\s*(\d+)")
+_PING_TIME_RE = re.compile(r"time[=<](\d+)")  # "time=12ms" / "time<1ms"
+# Keyword alternations, matched against upper-cased names
+_WIFI_RE = re.compile(r"WI-?FI|WIRELESS|WLAN|802\.11", re.IGNORECASE)
+_ETH_RE = re.compile(r"ETHERNET|LAN|REALTEK|INTEL I|KILLER", re.IGNORECASE)
+_ETH_IFACE_RE = re.compile(r"ETH|LAN|REALTEK|INTEL", re.IGNORECASE)  # psutil interface names
+_DISCRETE_GPU_RE = re.compile(r"NVIDIA|AMD|RADEON|GEFORCE|RTX|GTX|RX ", re.IGNORECASE)
+_REBAR_GPU_PATTERNS = frozenset({"RTX 30", "RTX 40", "RTX 50", "RX 6", "RX 7"})  # ReBAR-capable families
+_REBAR_GPU_RE = re.compile("|".join(map(re.escape, sorted(_REBAR_GPU_PATTERNS))), re.IGNORECASE)
+_HDD_MODEL_RE = re.compile(r"HDD|BARRACUDA|CAVIAR|IRONWOLF|WD BLUE WD10|WD BLACK WD", re.IGNORECASE)
+_RAM_FORM_FACTORS = {8: "DIMM", 12: "SODIMM"}
+_DISPLAY_CLASS_KEY = r"SYSTEM\CurrentControlSet\Control\Class\{4d36e968-e325-11ce-bfc1-08002be10318}"
+_ARCH_MAP = {0: "x86", 5: "ARM", 9: "AMD64", 12: "ARM64"}  # Win32_Processor.Architecture
+_SMBIOS_MEMORY_TYPES = {20: "DDR", 21: "DDR2", 22: "DDR2", 24: "DDR3", 26: "DDR4", 34: "DDR5"}
+_DDR5_MIN_SPEED_MHZ = 5200  # above any common DDR4 overclock
+
+
+def _parse_cache_kb(val):
+    """Parse a cpuinfo cache size and return the value in KB."""
+    if val is None:
+        return None
+    if isinstance(val, int):
+        # If raw int, assume bytes and convert to KB
+        return int(val / 1024) if val >= 1024 else val
+    m = _CACHE_RE.search(str(val).replace(",", ""))
+    if not m:
+        return None
+    num = float(m.group(1))
+    unit = (m.group(2) or "KB").upper()
+    return int(num * _CACHE_MULT_KB.get(unit, 1))
+
+
+def _nvml_call(fn, *args):
+    """Call an NVML query, returning None for NVMLError (e.g. NotSupported)."""
+    try:
+        return fn(*args)
+    except Exception:
+        return None
+
+
+def _reg_read(hive: str, path: str, name: str):
+    """Read a registry value in-process, or None (missing key / not Windows).
+
+    *hive* is a winreg constant name such as "HKEY_LOCAL_MACHINE".
+    """
+    try:
+        import winreg
+    except ImportError:
+        return None
+    try:
+        access = winreg.KEY_READ | winreg.KEY_WOW64_64KEY
+        with winreg.OpenKeyEx(getattr(winreg, hive), path, 0, access) as key:
+            return winreg.QueryValueEx(key, name)[0]
+    except OSError:
+        return None
+
+
+def _reg_subkeys(hive: str, path: str) -> list[str]:
+    """Names of the direct subkeys of *path* ([] when missing / not Windows)."""
+    try:
+        import winreg
+    except ImportError:
+        return []
+    names = []
+    try:
+        access = winreg.KEY_READ | winreg.KEY_WOW64_64KEY
+        with winreg.OpenKeyEx(getattr(winreg, hive), path, 0, access) as key:
+            i = 0
+            while True:
+                try:
+                    names.append(winreg.EnumKey(key, i))
+                except OSError:  # ERROR_NO_MORE_ITEMS
+                    break
+                i += 1
+    except OSError:
+        pass
+    return names
+
+
+# Command output is memoized for the length of one scan: a repeated
+# command (fallback paths, scans sharing a probe) costs a dict lookup rather
+# than another process spawn. _clear_command_cache() starts a fresh scan.
 def _run_cmd(cmd: str | list[str], timeout: int = 10) -> str:
     """Run a command and return stripped stdout, or empty string on failure.
 
     Accepts either a list of args (preferred, no shell) or a string
     (split via shlex, still no shell).
     """
+    return _run_cmd_cached(cmd if isinstance(cmd, str) else tuple(cmd), timeout)
+
+
+@lru_cache(maxsize=256)
+def _run_cmd_cached(cmd: str | tuple[str, ...], timeout: int) -> str:
     try:
         if isinstance(cmd, str):
             import shlex
             args = shlex.split(cmd, posix=False)
         else:
-            args = cmd
+            args = list(cmd)
+        # Raw bytes + explicit decode avoids the locale codec; stderr is
+        # never read, so don't pay for a pipe to capture it.
         result = subprocess.run(
-            args, capture_output=True, text=True, timeout=timeout, shell=False
+            args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=timeout, shell=False
         )
-        return result.stdout.strip()
+        return result.stdout.decode("utf-8", errors="replace").strip()
     except Exception as e:
         logging.debug("_run_cmd(%r) failed: %s", cmd, e)
         return ""
 
 
-def _run_powershell(script: str, timeout: int = 15) -> str:
-    """Execute a PowerShell snippet and return stdout."""
-    cmd = ["powershell", "-NoProfile", "-NonInteractive", "-Command", script]
+@lru_cache(maxsize=256)
+def _run_cmd_oneline(cmd: tuple[str, ...], timeout: int = 10) -> str:
+    """Return the first non-empty stdout line of *cmd*, then stop the process.
+
+    For probes that print the answer up front: nothing after that line is
+    read or buffered, and the process is not waited on to exit by itself.
+    """
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        return result.stdout.strip()
-    except Exception:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        logging.debug("_run_cmd_oneline(%r) failed: %s", cmd, e)
         return ""
+    timer = threading.Timer(timeout, proc.kill)  # unblocks readline on a hang
+    timer.start()
+    try:
+        for raw in proc.stdout:
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                return line
+        return ""
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.terminate()
+        proc.stdout.close()
+        proc.wait()
 
 
-def _wmic(path: str, fields: str, timeout: int = 10) -> list[dict]:
-    """
-    Query wmic and return a list of dicts.
-    Example: _wmic("cpu", "Name,NumberOfCores")
+# Force PowerShell to write UTF-8 so _run_powershell can decode without guessing.
+_PS_UTF8_PREFIX = "$OutputEncoding = [Console]::OutputEncoding = [Text.UTF8Encoding]::new(); "
+
+# -NoProfile:                skip user/machine profile scripts (can add seconds per spawn)
+# -NonInteractive:           fail instead of blocking on a prompt
+# -ExecutionPolicy Bypass:   no policy lookup / script-signing checks for this process
+_PS_FLAGS = ("-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass")
+
+
+@lru_cache(maxsize=1)
+def _powershell_exe() -> str:
+    """PowerShell 7 (pwsh) if installed — it starts faster — else Windows PowerShell."""
+    import shutil
+    return shutil.which("pwsh") or "powershell"
+
+
+class _PowerShellSession:
+    """One long-lived PowerShell process that runs scripts fed over stdin.
+
+    Starting powershell.exe costs a few hundred ms, so it is paid once per
+    process instead of once per call. Each script is sent base64-encoded on
+    a single line (no quoting or multi-line parsing issues) followed by an
+    end marker; stdout is collected until the marker comes back. Calls are
+    serialized, and a timed-out or dead session is restarted on next use.
     """
-    raw = _run_cmd(["wmic", path, "get", fields, "/format:list"], timeout=timeout)
+
+    def __init__(self):
+        self._proc: subprocess.Popen | None = None
+        self._lines = None  # queue.Queue of stdout lines, created by _start()
+        self._lock = threading.Lock()
+        self._marker = f"__PCBN_END_{os.urandom(8).hex()}__"
+
+    def _start(self) -> bool:
+        import queue
+
+        cmd = [_powershell_exe(), "-NoLogo", *_PS_FLAGS, "-Command", "-"]
+        try:
+            self._proc = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            logging.debug("PowerShell session failed to start: %s", e)
+            self._proc = None
+            return False
+        # stdout is drained by a thread so run() can wait on it with a timeout
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._proc.stdout, self._lines), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _pump(stream, lines):
+        for raw in stream:
+            lines.put(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+        lines.put(None)  # EOF: the process exited
+
+    def _kill(self):
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def run(self, script: str, timeout: float) -> str:
+        """Run *script* and return its stripped stdout ("" on failure or timeout)."""
+        import base64
+        import queue
+
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                if not self._start():
+                    return ""
+            encoded = base64.b64encode((_PS_UTF8_PREFIX + script).encode("utf-8")).decode("ascii")
+            line = (
+                "try { & ([ScriptBlock]::Create([Text.Encoding]::UTF8.GetString("
+                "[Convert]::FromBase64String('" + encoded + "')))) } catch {}; "
+                "'" + self._marker + "'\n"
+            )
+            try:
+                self._proc.stdin.write(line.encode("ascii"))
+                self._proc.stdin.flush()
+            except OSError:
+                self._kill()
+                return ""
+
+            out = []
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    item = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    logging.debug("PowerShell script timed out after %ss; restarting session", timeout)
+                    self._kill()
+                    return ""
+                if item is None:
+                    self._kill()
+                    return ""
+                if item == self._marker:
+                    return "\n".join(out).strip()
+                out.append(item)
+
+    def close(self):
+        """Ask PowerShell to exit (killing it if it doesn't)."""
+        with self._lock:
+            if self._proc is None:
+                return
+            try:
+                self._proc.stdin.write(b"exit\n")
+                self._proc.stdin.close()
+                self._proc.wait(timeout=3)
+                self._proc = None
+            except (OSError, subprocess.TimeoutExpired):
+                self._kill()
+
+
+_PS_SESSION = _PowerShellSession()
+
+
+@lru_cache(maxsize=256)
+def _run_powershell(script: str, timeout: int = 15) -> str:
+    """Execute a PowerShell snippet in the shared session and return stdout."""
+    return _PS_SESSION.run(script, timeout)
+
+
+def _clear_command_cache():
+    """Forget memoized command output so the next scan / snapshot reads live values."""
+    _run_cmd_cached.cache_clear()
+    _run_cmd_oneline.cache_clear()
+    _run_powershell.cache_clear()
+
+
+def _json_rows(data) -> list[dict]:
+    """Normalise ConvertTo-Json output (which unwraps single objects) to a list of dicts."""
+    if isinstance(data, dict):
+        return [data]
+    if isinstance(data, list):
+        return [r for r in data if isinstance(r, dict)]
+    return []
+
+
+def _ps_rows(script: str, timeout: int = 15) -> list[dict]:
+    """Run a PowerShell script ending in ConvertTo-Json and return its rows."""
+    raw = _run_powershell(script, timeout=timeout)
     if not raw:
         return []
-    entries: list[dict] = []
-    current: dict = {}
-    for line in raw.splitlines():
-        line = line.strip()
-        if "=" in line:
-            key, _, value = line.partition("=")
-            current[key.strip()] = value.strip()
-        elif not line and current:
-            entries.append(current)
-            current = {}
-    if current:
-        entries.append(current)
-    return entries
+    try:
+        return _json_rows(_json_loads(raw))
+    except ValueError as e:
+        logging.debug("PowerShell JSON parse failed: %s", e)
+        return []
+
+
+def _cim_query(class_name: str, fields: str, timeout: int = 15) -> list[dict]:
+    """
+    Query a CIM class via Get-CimInstance and return a list of dicts.
+    Stands in for the deprecated wmic.exe (gone in Windows 11 24H2).
+    Example: _cim_query("Win32_Processor", "Name,NumberOfCores")
+    """
+    return _ps_rows(
+        f"Get-CimInstance -ClassName {class_name} -Property {fields} -ErrorAction SilentlyContinue | "
+        f"Select-Object {fields} | ConvertTo-Json -Compress",
+        timeout=timeout,
+    )
+
+
+# The registry / TPM probes every scan needs, sent to the PowerShell session
+# as one script so they share a single round trip. Anything that is only a
+# fallback (GPU, disks, board, BIOS) is queried through the session on demand.
+# Registry values go through .NET RegistryKey (rv / sk helpers) rather than
+# Get-ItemProperty, which spins up the registry provider for every path.
+_PS_BUNDLE_SCRIPT = (
+    "$lm = [Microsoft.Win32.RegistryKey]::OpenBaseKey('LocalMachine', 'Registry64'); "
+    "function rv($key, $path, $name) { try { $k = $key.OpenSubKey($path); "
+    "if ($k) { $k.GetValue($name); $k.Close() } } catch {} }; "
+    "function sk($key, $path) { try { $k = $key.OpenSubKey($path); "
+    "if ($k) { $k.GetSubKeyNames(); $k.Close() } } catch {} }; "
+    "$pci = 'SYSTEM\\CurrentControlSet\\Enum\\PCI'; "
+    "@{"
+    "chipset = $($hit = $null; foreach ($dev in (sk $lm $pci)) { "
+    "foreach ($inst in (sk $lm ($pci + '\\' + $dev))) { if (-not $hit) { "
+    "$d = rv $lm ($pci + '\\' + $dev + '\\' + $inst) 'DeviceDesc'; "
+    "if ($d -match 'chipset|ISA|LPC|SMBus') { $hit = $d } } } }; $hit); "
+    # Get-Tpm throws without admin; catch it so it cannot abort the whole bundle
+    "tpm_present = $(try { (Get-Tpm -ErrorAction Stop).TpmPresent } catch { $null })"
+    "} | ConvertTo-Json -Depth 4 -Compress"
+)
+_PS_BUNDLE: dict | None = None
+_PS_BUNDLE_LOCK = threading.Lock()
+
+
+def _powershell_bundle() -> dict:
+    """Return the batched PowerShell inventory, running PowerShell at most once."""
+    global _PS_BUNDLE
+    with _PS_BUNDLE_LOCK:
+        if _PS_BUNDLE is None:
+            _PS_BUNDLE = {}
+            raw = _run_powershell(_PS_BUNDLE_SCRIPT)
+            if raw:
+                try:
+                    data = _json_loads(raw)
+                    if isinstance(data, dict):
+                        _PS_BUNDLE = data
+                except ValueError as e:
+                    logging.debug("PowerShell bundle parse failed: %s", e)
+    return _PS_BUNDLE
+
+
+# One COM handle per WMI namespace, bound on first use and shared by every
+# scan_* function. Binding a namespace is an expensive IWbemServices
+# round-trip, so a failed bind is remembered as False and never retried.
+_WMI_NAMESPACES = {
+    "cimv2": "root\\cimv2",
+    "wmi": "root\\wmi",
+    "ohm": "root\\OpenHardwareMonitor",
+    "lhm": "root\\LibreHardwareMonitor",
+    "storage": "root\\Microsoft\\Windows\\Storage",
+    "tpm": "root\\cimv2\\Security\\MicrosoftTpm",
+}
+_WMI_CACHE = {"cimv2": None, "wmi": None, "ohm": None, "lhm": None, "storage": None, "tpm": None}
+_WMI_LOCK = threading.Lock()
+
+
+def _get_wmi_namespace(key: str):
+    """Return the cached WMI connection for namespace *key*, or None."""
+    wmi_module = _get_wmi_module()
+    if wmi_module is None:
+        return None
+    with _WMI_LOCK:
+        conn = _WMI_CACHE[key]
+        if conn is None:
+            try:
+                conn = wmi_module.WMI(namespace=_WMI_NAMESPACES[key])
+            except Exception:
+                conn = False
+            _WMI_CACHE[key] = conn
+    return conn if conn is not False else None
 
 
 def _get_wmi_conn():
-    """Return a WMI connection object, or None."""
-    if not _WMI_AVAILABLE:
+    """Return the shared root\\cimv2 WMI connection, or None."""
+    return _get_wmi_namespace("cimv2")
+
+
+def _get_wmi_conn_ms():
+    """Return the shared root\\wmi connection for MSAcpi_ThermalZoneTemperature (needs admin)."""
+    return _get_wmi_namespace("wmi")
+
+
+# Key of a WMI object path, e.g. ...Win32_DiskDrive.DeviceID="\\\\.\\PHYSICALDRIVE0"
+_WMI_REF_ID_RE = re.compile(r'DeviceID="((?:[^"\\]|\\.)*)"')
+_WMI_UNESCAPE_RE = re.compile(r"\\(.)")
+
+
+def _wmi_ref_device_id(obj, prop: str) -> str | None:
+    """Return the DeviceID named by reference property *prop* of an association row.
+
+    Reads the raw object path: going through the wmi wrapper would resolve the
+    reference into a full object, costing another WMI round-trip per row.
+    """
+    path = obj.ole_object.Properties_(prop).Value or ""
+    m = _WMI_REF_ID_RE.search(path)
+    return _WMI_UNESCAPE_RE.sub(r"\1", m.group(1)) if m else None
+
+
+def _disk_drive_letters(w) -> dict[str, list[str]]:
+    """Map Win32_DiskDrive.DeviceID -> logical drive letters with two flat queries."""
+    partition_letters: dict[str, list[str]] = {}
+    for link in w.query("SELECT Antecedent, Dependent FROM Win32_LogicalDiskToPartition"):
+        part_id = _wmi_ref_device_id(link, "Antecedent")
+        letter = _wmi_ref_device_id(link, "Dependent")
+        if part_id and letter:
+            partition_letters.setdefault(part_id, []).append(letter)
+
+    disk_letters: dict[str, list[str]] = {}
+    for link in w.query("SELECT Antecedent, Dependent FROM Win32_DiskDriveToDiskPartition"):
+        disk_id = _wmi_ref_device_id(link, "Antecedent")
+        part_id = _wmi_ref_device_id(link, "Dependent")
+        if disk_id and part_id:
+            disk_letters.setdefault(disk_id, []).extend(partition_letters.get(part_id, ()))
+    return disk_letters
+
+
+# MSFT_PhysicalDisk enumerations (root\\Microsoft\\Windows\\Storage)
+_MSFT_MEDIA_HDD = 3
+_MSFT_MEDIA_SSD = (4, 5)  # SSD, SCM
+_MSFT_BUS_NVME = 17
+_MSFT_HEALTH = {0: "Healthy", 1: "Warning", 2: "Unhealthy"}
+
+
+def _physical_disk_info() -> dict[int, tuple]:
+    """Map disk number -> (MediaType, BusType, health) from MSFT_PhysicalDisk."""
+    conn = _get_wmi_namespace("storage")
+    if not conn:
+        return {}
+    info = {}
+    for pd in conn.query("SELECT DeviceId, MediaType, BusType, HealthStatus FROM MSFT_PhysicalDisk"):
+        idx = _safe_int(getattr(pd, "DeviceId", None))
+        if idx is not None:
+            info[idx] = (
+                _safe_int(getattr(pd, "MediaType", None)),
+                _safe_int(getattr(pd, "BusType", None)),
+                _MSFT_HEALTH.get(_safe_int(getattr(pd, "HealthStatus", None))),
+            )
+    return info
+
+
+def _com_initialize():
+    """Join COM's multithreaded apartment for the whole run; pythoncom, or None.
+
+    While the main thread holds the MTA, the scan pool's worker threads run in
+    it implicitly and can use the cached WMI connections without their own
+    CoInitializeEx / CoUninitialize pair.
+    """
+    if _get_wmi_module() is None:
         return None
+    import pythoncom
+    pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+    return pythoncom
+
+
+def _com_uninitialize(pythoncom):
+    """Release the cached WMI connections, then leave the apartment."""
+    with _WMI_LOCK:
+        for key in _WMI_CACHE:
+            _WMI_CACHE[key] = None
+    pythoncom.CoUninitialize()
+
+
+# ---------------------------------------------------------------------------
+# Live sensors — read directly by the scans, or published once a second by
+# sensor_daemon.py into shared memory so repeated scans skip the queries.
+# ---------------------------------------------------------------------------
+
+_SENSOR_SHM_NAME = "pcbn_sensors"
+_SENSOR_SHM_SIZE = 256
+_SENSOR_FIELDS = (
+    "cpu_temp_c", "cpu_power_w",
+    "gpu_temp_c", "gpu_utilization_pct", "gpu_clock_mhz", "memory_clock_mhz", "vram_used_gb",
+)
+# Sequence counter (odd while the daemon is writing), unix time, then one
+# double per field with NaN for "not available".
+_SENSOR_GPU_FIELDS = (  # daemon field -> GPUInfo field
+    ("gpu_temp_c", "current_temp_c"),
+    ("gpu_utilization_pct", "gpu_utilization_pct"),
+    ("gpu_clock_mhz", "gpu_clock_mhz"),
+    ("memory_clock_mhz", "memory_clock_mhz"),
+    ("vram_used_gb", "vram_used_gb"),
+)
+_SENSOR_STRUCT = struct.Struct("<Qd" + "d" * len(_SENSOR_FIELDS))
+_SENSOR_MAX_AGE_S = 3.0
+
+
+def _read_cpu_temp() -> float | None:
+    """CPU temperature in °C (usually needs admin), or None."""
+    # psutil only reads sensors on Linux/BSD (/sys/class/thermal); on Windows
+    # go straight to WMI.
+    psutil = _get_psutil()
     try:
-        return wmi_module.WMI()
+        if sys.platform != "win32" and psutil and hasattr(psutil, "sensors_temperatures"):
+            temps = psutil.sensors_temperatures()
+            if temps:
+                for name in ("coretemp", "k10temp", "cpu_thermal", "acpitz"):
+                    if name in temps and temps[name]:
+                        return temps[name][0].current
     except Exception:
-        return None
+        pass
 
+    # WMI thermal fallback (admin required)
+    try:
+        wmi_ms = _get_wmi_conn_ms()
+        if wmi_ms:
+            # Readings are tenths of a kelvin; let WMI drop zones outside 0-120 °C
+            zones = wmi_ms.query(
+                "SELECT CurrentTemperature FROM MSAcpi_ThermalZoneTemperature "
+                "WHERE CurrentTemperature > 2731 AND CurrentTemperature < 3931"
+            )
+            if zones:
+                kelvin_tenths = _safe_float(zones[0].CurrentTemperature)
+                if kelvin_tenths:
+                    return round((kelvin_tenths / 10.0) - 273.15, 1)
+    except Exception:
+        pass
+    return None
 
-def _get_wmi_conn_ms():
-    """Return a WMI connection to MSAcpi_ThermalZoneTemperature (needs admin)."""
-    if not _WMI_AVAILABLE:
+
+def _read_cpu_power() -> float | None:
+    """CPU package power in watts from OpenHardwareMonitor / LibreHardwareMonitor WMI, or None."""
+    # Filter in WQL so only power sensors are marshalled, and stop at the
+    # first namespace that answers (LHM is never bound if OHM reports).
+    for namespace in ("ohm", "lhm"):
+        try:
+            conn = _get_wmi_namespace(namespace)
+            if conn:
+                for sensor in conn.query("SELECT Name, Value FROM Sensor WHERE SensorType = 'Power'"):
+                    if "CPU" in (sensor.Name or ""):
+                        return round(float(sensor.Value), 1)
+        except Exception:
+            pass
+    return None
+
+
+@lru_cache(maxsize=1)
+def _nvml_handle():
+    """(pynvml, handle) for the first NVIDIA GPU, or None without NVML / a GPU."""
+    nvml = _get_nvml()
+    if not nvml:
         return None
     try:
-        return wmi_module.WMI(namespace="root\\wmi")
+        return nvml, nvml.nvmlDeviceGetHandleByIndex(0)
     except Exception:
         return None
 
 
+def _read_gpu_live() -> dict | None:
+    """Live NVIDIA counters via NVML (GPUInfo field names), or None without NVML."""
+    nvml_handle = _nvml_handle()
+    if nvml_handle is None:
+        return None
+    nvml, h = nvml_handle
+    live = {
+        "current_temp_c": _safe_float(_nvml_call(nvml.nvmlDeviceGetTemperature, h, nvml.NVML_TEMPERATURE_GPU)),
+        "gpu_utilization_pct": None,
+        "vram_used_gb": None,
+        "gpu_clock_mhz": _safe_float(_nvml_call(nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_GRAPHICS)),
+        "memory_clock_mhz": _safe_float(_nvml_call(nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_MEM)),
+    }
+    util = _nvml_call(nvml.nvmlDeviceGetUtilizationRates, h)
+    if util is not None:
+        live["gpu_utilization_pct"] = _safe_float(util.gpu)
+    mem = _nvml_call(nvml.nvmlDeviceGetMemoryInfo, h)
+    if mem is not None:
+        live["vram_used_gb"] = _bytes_to_gb(mem.used)
+    return live
+
+
+def _sensor_snapshot() -> dict | None:
+    """Latest readings published by sensor_daemon.py, or None if it is not running or stale."""
+    import math
+
+    try:
+        from multiprocessing import shared_memory
+
+        # Attaching must not register the block for cleanup at exit, or a POSIX
+        # reader would unlink the daemon's segment (3.13+ has track=False).
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=_SENSOR_SHM_NAME, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=_SENSOR_SHM_NAME)
+            if os.name == "posix":
+                from multiprocessing import resource_tracker
+
+                resource_tracker.unregister(shm._name, "shared_memory")
+    except (ImportError, OSError, ValueError):
+        return None
+    try:
+        # Seqlock read: retry if the daemon was mid-write
+        for _ in range(3):
+            seq, ts, *values = _SENSOR_STRUCT.unpack_from(shm.buf)
+            if seq % 2 == 0 and _SENSOR_STRUCT.unpack_from(shm.buf)[0] == seq:
+                break
+        else:
+            return None
+    except struct.error:
+        return None
+    finally:
+        shm.close()
+    if time.time() - ts > _SENSOR_MAX_AGE_S:
+        return None
+    return {k: (None if math.isnan(v) else v) for k, v in zip(_SENSOR_FIELDS, values)}
+
+
+# ---------------------------------------------------------------------------
+# Result types — field order is the JSON key order the dashboard expects;
+# scan_* functions return _as_dict() of these.
+# ---------------------------------------------------------------------------
+
+def _as_dict(obj) -> dict:
+    """Flat field dict of a slotted result dataclass, in field order.
+
+    dataclasses.asdict() deep-copies recursively; these results hold only
+    scalars and flat lists that are discarded after conversion, so a
+    shallow read of the slots is enough.
+    """
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+
+@dataclass(slots=True)
+class CPUInfo:
+    model_name: str = "unavailable"
+    architecture: str = "unavailable"
+    physical_cores: int | None = None
+    logical_cores: int | None = None
+    base_clock_ghz: float | None = None
+    max_boost_clock_ghz: float | None = None
+    current_clock_ghz: float | None = None
+    cache_l1: int | None = None  # KB — matches dashboard CPUInfo interface
+    cache_l2: int | None = None  # KB
+    cache_l3: int | None = None  # KB
+    current_temp_c: float | None = None
+    usage_per_core: list[float] = field(default_factory=list)
+    power_draw_w: float | None = None
+
+
+@dataclass(slots=True)
+class GPUInfo:
+    model_name: str = "unavailable"
+    vram_total_gb: float | None = None
+    vram_used_gb: float | None = None
+    gpu_clock_mhz: float | None = None
+    memory_clock_mhz: float | None = None
+    current_temp_c: float | None = None
+    fan_speed_pct: float | None = None
+    driver_version: str | None = None
+    gpu_utilization_pct: float | None = None
+    pcie_generation: int | None = None
+    pcie_link_width: int | None = None
+
+
+@dataclass(slots=True)
+class RAMInfo:
+    total_gb: float | None = None
+    speed_mhz: int | None = None
+    rated_speed_mhz: int | None = None
+    num_sticks: int | None = None
+    num_slots: int | None = None
+    channel_mode: str | None = None
+    form_factor: str | None = None  # Will include DDR gen, e.g. "DIMM DDR4"
+    timings: str | None = None  # String like "16-18-18-38" or null
+    current_used_gb: float | None = None
+    usage_percent: float | None = None
+
+
+@dataclass(slots=True)
+class DriveInfo:
+    model: str = "unavailable"
+    type: str = "unavailable"
+    capacity_gb: float | None = None
+    used_gb: float | None = None
+    free_gb: float | None = None
+    interface: str = "unavailable"
+    health_status: str | None = None
+    is_boot_drive: bool = False
+
+
+@dataclass(slots=True)
+class MotherboardInfo:
+    model: str = "unavailable"
+    chipset: str | None = None
+    bios_version: str = "unavailable"
+    bios_date: str | None = None
+
+
+@dataclass(slots=True)
+class OSInfo:
+    windows_version: str = "unavailable"
+    build_number: str | None = None
+    is_up_to_date: bool | None = None
+    power_plan: str | None = None
+    game_mode: bool | None = None
+    hw_accelerated_gpu_scheduling: bool | None = None
+    virtual_memory_gb: float | None = None
+
+
+@dataclass(slots=True)
+class NetworkInfo:
+    connection_type: str = "unavailable"
+    speed_mbps: float | None = None
+    latency_ms: float | None = None
+
+
+@dataclass(slots=True)
+class BIOSSettings:
+    xmp_enabled: bool | None = None
+    resizable_bar: bool | None = None
+    tpm_status: str | None = None
+    virtualization: bool | None = None
+    secure_boot: bool | None = None
+
+
 # ---------------------------------------------------------------------------
 # CPU Detection
 # ---------------------------------------------------------------------------
 
-def scan_cpu() -> dict:
-    """Collect CPU information from multiple sources."""
+@lru_cache(maxsize=1)
+def _cpu_static() -> MappingProxyType:
+    """CPU fields that never change within a boot, queried once per process.
+
+    Model, caches, core counts and rated clocks cost several WMI / cpuinfo
+    round-trips; repeated scans (e.g. --monitor) reuse this frozen result.
+    """
+    psutil = _get_psutil()
     cpu = {
         "model_name": "unavailable",
-        "architecture": platform.machine() or "unavailable",
+        "architecture": "unavailable",
         "physical_cores": None,
         "logical_cores": None,
         "base_clock_ghz": None,
         "max_boost_clock_ghz": None,
-        "current_clock_ghz": None,
-        "cache_l1": None,      # KB — matches dashboard CPUInfo interface
-        "cache_l2": None,      # KB
-        "cache_l3": None,      # KB
-        "current_temp_c": None,
-        "usage_per_core": [],
-        "power_draw_w": None,
+        "current_clock_ghz": None,  # cpuinfo reading; refreshed by scan_cpu()
+        "cache_l1": None,
+        "cache_l2": None,
+        "cache_l3": None,
     }
 
-    # --- py-cpuinfo ---
-    try:
-        if cpuinfo_module:
-            info = cpuinfo_module.get_cpu_info()
-            cpu["model_name"] = info.get("brand_raw", cpu["model_name"])
-            cpu["architecture"] = info.get("arch_string_raw", cpu["architecture"])
-            hz_actual = info.get("hz_actual_friendly", "")
-            if hz_actual:
-                ghz_match = re.search(r"([\d.]+)\s*GHz", hz_actual, re.IGNORECASE)
-                if ghz_match:
-                    cpu["current_clock_ghz"] = _safe_float(ghz_match.group(1))
-            hz_advertised = info.get("hz_advertised_friendly", "")
-            if hz_advertised:
-                ghz_match = re.search(r"([\d.]+)\s*GHz", hz_advertised, re.IGNORECASE)
-                if ghz_match:
-                    cpu["base_clock_ghz"] = _safe_float(ghz_match.group(1))
-            # Cache sizes from cpuinfo
-            l1_data = info.get("l1_data_cache_size")
-            l1_inst = info.get("l1_instruction_cache_size")
-            l2 = info.get("l2_cache_size")
-            l3 = info.get("l3_cache_size")
-
-            def _parse_cache_kb(val):
-                """Parse cache size and return value in KB."""
-                if val is None:
-                    return None
-                if isinstance(val, int):
-                    # If raw int, assume bytes and convert to KB
-                    return int(val / 1024) if val >= 1024 else val
-                s = str(val).upper().replace(",", "")
-                m = re.search(r"([\d.]+)\s*(KB|MB|GB|B)?", s)
-                if not m:
-                    return None
-                num = float(m.group(1))
-                unit = m.group(2) or "KB"
-                mult_to_kb = {"B": 1/1024, "KB": 1, "MB": 1024, "GB": 1024**2}
-                return int(num * mult_to_kb.get(unit, 1))
-
-            if l1_data or l1_inst:
-                l1d = _parse_cache_kb(l1_data) or 0
-                l1i = _parse_cache_kb(l1_inst) or 0
-                cpu["cache_l1"] = (l1d + l1i) if (l1d or l1i) else None
-            cpu["cache_l2"] = _parse_cache_kb(l2)
-            cpu["cache_l3"] = _parse_cache_kb(l3)
-    except Exception as e:
-        logging.debug("cpuinfo failed: %s", e)
+    # --- Brand string straight from the registry (no CPUID sweep) ---
+    brand = _reg_read(
+        "HKEY_LOCAL_MACHINE", r"HARDWARE\DESCRIPTION\System\CentralProcessor\0", "ProcessorNameString"
+    )
+    if isinstance(brand, str) and brand.strip():
+        cpu["model_name"] = brand.strip()
 
     # --- psutil ---
     try:
@@ -234,22 +936,28 @@ def scan_cpu() -> dict:
             if freqs:
                 if freqs.max and freqs.max > 0:
                     cpu["max_boost_clock_ghz"] = round(freqs.max / 1000, 2)
-                if freqs.current and freqs.current > 0:
-                    cpu["current_clock_ghz"] = round(freqs.current / 1000, 2)
                 if cpu["base_clock_ghz"] is None and freqs.min and freqs.min > 0:
                     cpu["base_clock_ghz"] = round(freqs.min / 1000, 2)
-            per_core = psutil.cpu_percent(interval=0.5, percpu=True)
-            cpu["usage_per_core"] = per_core if per_core else []
     except Exception as e:
         logging.debug("psutil CPU scan failed: %s", e)
 
-    # --- WMI for base clock ---
+    # --- WMI for base clock (projected query also covers the CIM fallback fields) ---
     try:
         w = _get_wmi_conn()
         if w:
-            for proc in w.Win32_Processor():
+            for proc in w.query(
+                "SELECT Name, Architecture, MaxClockSpeed, NumberOfCores, NumberOfLogicalProcessors, "
+                "L2CacheSize, L3CacheSize FROM Win32_Processor"
+            ):
                 if cpu["model_name"] == "unavailable":
                     cpu["model_name"] = getattr(proc, "Name", cpu["model_name"]).strip()
+                arch = _safe_int(getattr(proc, "Architecture", None))
+                if arch in _ARCH_MAP:
+                    cpu["architecture"] = _ARCH_MAP[arch]
+                if cpu["physical_cores"] is None:
+                    cpu["physical_cores"] = _safe_int(getattr(proc, "NumberOfCores", None))
+                if cpu["logical_cores"] is None:
+                    cpu["logical_cores"] = _safe_int(getattr(proc, "NumberOfLogicalProcessors", None))
                 max_mhz = _safe_int(getattr(proc, "MaxClockSpeed", None))
                 if max_mhz and cpu["base_clock_ghz"] is None:
                     cpu["base_clock_ghz"] = round(max_mhz / 1000, 2)
@@ -262,16 +970,59 @@ def scan_cpu() -> dict:
                     if l3_kb:
                         cpu["cache_l3"] = l3_kb  # Already in KB from WMI
                 break
+            # L1 (CIM cache level 3 = "Primary"), total KB across cores
+            l1_kb = sum(
+                _safe_int(getattr(c, "InstalledSize", None)) or 0
+                for c in w.query("SELECT InstalledSize FROM Win32_CacheMemory WHERE Level = 3")
+            )
+            if l1_kb:
+                cpu["cache_l1"] = l1_kb
     except Exception:
         pass
 
-    # --- wmic fallback for model ---
+    # --- py-cpuinfo, only for whatever the registry / psutil / WMI left empty ---
+    # get_cpu_info() runs a full CPUID sweep (~200 ms), so skip it when possible.
+    gaps = ("base_clock_ghz", "cache_l1", "cache_l2", "cache_l3")
+    if cpu["model_name"] == "unavailable" or any(cpu[k] is None for k in gaps):
+        try:
+            cpuinfo = _get_cpuinfo()
+            if cpuinfo:
+                info = cpuinfo.get_cpu_info()
+                if cpu["model_name"] == "unavailable":
+                    cpu["model_name"] = info.get("brand_raw", cpu["model_name"])
+                if cpu["architecture"] == "unavailable":
+                    cpu["architecture"] = info.get("arch_string_raw", cpu["architecture"])
+                hz_actual = info.get("hz_actual_friendly", "")
+                if hz_actual:
+                    ghz_match = _GHZ_RE.search(hz_actual)
+                    if ghz_match:
+                        cpu["current_clock_ghz"] = _safe_float(ghz_match.group(1))
+                hz_advertised = info.get("hz_advertised_friendly", "")
+                if hz_advertised and cpu["base_clock_ghz"] is None:
+                    ghz_match = _GHZ_RE.search(hz_advertised)
+                    if ghz_match:
+                        cpu["base_clock_ghz"] = _safe_float(ghz_match.group(1))
+                # Cache sizes from cpuinfo
+                l1_data = info.get("l1_data_cache_size")
+                l1_inst = info.get("l1_instruction_cache_size")
+                if cpu["cache_l1"] is None and (l1_data or l1_inst):
+                    l1d = _parse_cache_kb(l1_data) or 0
+                    l1i = _parse_cache_kb(l1_inst) or 0
+                    cpu["cache_l1"] = (l1d + l1i) if (l1d or l1i) else None
+                if cpu["cache_l2"] is None:
+                    cpu["cache_l2"] = _parse_cache_kb(info.get("l2_cache_size"))
+                if cpu["cache_l3"] is None:
+                    cpu["cache_l3"] = _parse_cache_kb(info.get("l3_cache_size"))
+        except Exception as e:
+            logging.debug("cpuinfo failed: %s", e)
+
+    # --- Get-CimInstance fallback for model (normally only reached when WMI COM is unavailable) ---
     if cpu["model_name"] == "unavailable":
         try:
-            rows = _wmic("cpu", "Name,MaxClockSpeed,NumberOfCores,NumberOfLogicalProcessors,L2CacheSize,L3CacheSize")
+            rows = _cim_query("Win32_Processor", "Name,MaxClockSpeed,NumberOfCores,NumberOfLogicalProcessors")
             if rows:
                 r = rows[0]
-                cpu["model_name"] = r.get("Name", cpu["model_name"])
+                cpu["model_name"] = (r.get("Name") or cpu["model_name"]).strip()
                 if cpu["physical_cores"] is None:
                     cpu["physical_cores"] = _safe_int(r.get("NumberOfCores"))
                 if cpu["logical_cores"] is None:
@@ -283,56 +1034,44 @@ def scan_cpu() -> dict:
         except Exception:
             pass
 
-    # --- Temperature (needs admin usually) ---
-    try:
-        if psutil and hasattr(psutil, "sensors_temperatures"):
-            temps = psutil.sensors_temperatures()
-            if temps:
-                for name in ("coretemp", "k10temp", "cpu_thermal", "acpitz"):
-                    if name in temps and temps[name]:
-                        cpu["current_temp_c"] = temps[name][0].current
-                        break
-    except Exception:
-        pass
+    if cpu["architecture"] == "unavailable":
+        cpu["architecture"] = _platform_info()["machine"] or "unavailable"
 
-    # WMI thermal fallback (admin required)
-    if cpu["current_temp_c"] is None:
-        try:
-            wmi_ms = _get_wmi_conn_ms()
-            if wmi_ms:
-                for tz in wmi_ms.MSAcpi_ThermalZoneTemperature():
-                    kelvin_tenths = _safe_float(tz.CurrentTemperature)
-                    if kelvin_tenths:
-                        celsius = (kelvin_tenths / 10.0) - 273.15
-                        if 0 < celsius < 120:
-                            cpu["current_temp_c"] = round(celsius, 1)
-                            break
-        except Exception:
-            pass
+    return MappingProxyType(cpu)
 
-    # --- CPU Power draw via LibreHardwareMonitor / OpenHardwareMonitor WMI (if running) ---
-    try:
-        if _WMI_AVAILABLE:
-            ohm = wmi_module.WMI(namespace="root\\OpenHardwareMonitor")
-            for sensor in ohm.Sensor():
-                if sensor.SensorType == "Power" and "CPU" in sensor.Name:
-                    cpu["power_draw_w"] = round(float(sensor.Value), 1)
-                    break
-    except Exception:
-        pass
 
-    if cpu["power_draw_w"] is None:
-        try:
-            if _WMI_AVAILABLE:
-                lhm = wmi_module.WMI(namespace="root\\LibreHardwareMonitor")
-                for sensor in lhm.Sensor():
-                    if sensor.SensorType == "Power" and "CPU" in sensor.Name:
-                        cpu["power_draw_w"] = round(float(sensor.Value), 1)
-                        break
-        except Exception:
-            pass
+def scan_cpu() -> dict:
+    """Collect CPU information from multiple sources."""
+    psutil = _get_psutil()
+    cpu = CPUInfo(**_cpu_static())
+
+    # --- Current clock (psutil) ---
+    try:
+        if psutil:
+            freqs = psutil.cpu_freq(percpu=False)
+            if freqs and freqs.current and freqs.current > 0:
+                cpu.current_clock_ghz = round(freqs.current / 1000, 2)
+    except Exception as e:
+        logging.debug("psutil CPU frequency failed: %s", e)
+
+    # --- Temperature / power: sensor daemon if running, else query directly ---
+    live = _sensor_snapshot() or {}
+    cpu.current_temp_c = live.get("cpu_temp_c")
+    if cpu.current_temp_c is None:
+        cpu.current_temp_c = _read_cpu_temp()
+    cpu.power_draw_w = live.get("cpu_power_w")
+    if cpu.power_draw_w is None:
+        cpu.power_draw_w = _read_cpu_power()
+
+    # --- Per-core usage since the import-time primer (non-blocking) ---
+    try:
+        if psutil:
+            per_core = psutil.cpu_percent(percpu=True)
+            cpu.usage_per_core = per_core if per_core else []
+    except Exception as e:
+        logging.debug("psutil CPU usage failed: %s", e)
 
-    return cpu
+    return _as_dict(cpu)
 
 
 # ---------------------------------------------------------------------------
@@ -340,173 +1079,181 @@ def scan_cpu() -> dict:
 # ---------------------------------------------------------------------------
 
 def scan_gpu() -> dict:
-    gpu = {
-        "model_name": "unavailable",
-        "vram_total_gb": None,
-        "vram_used_gb": None,
-        "gpu_clock_mhz": None,
-        "memory_clock_mhz": None,
-        "current_temp_c": None,
-        "fan_speed_pct": None,
-        "driver_version": None,
-        "gpu_utilization_pct": None,
-        "pcie_generation": None,
-        "pcie_link_width": None,
-    }
-
-    # --- GPUtil ---
-    try:
-        if GPUtil:
-            gpus = GPUtil.getGPUs()
-            if gpus:
-                g = gpus[0]
-                gpu["model_name"] = g.name or gpu["model_name"]
-                gpu["vram_total_gb"] = round(g.memoryTotal / 1024, 2) if g.memoryTotal else None
-                gpu["vram_used_gb"] = round(g.memoryUsed / 1024, 2) if g.memoryUsed else None
-                gpu["current_temp_c"] = g.temperature
-                gpu["gpu_utilization_pct"] = g.load * 100 if g.load is not None else None
-                gpu["driver_version"] = g.driver
-    except Exception:
-        pass
+    GPUtil = _get_gputil()
+    gpu = GPUInfo()
+
+    # --- Live counters: sensor daemon if running, NVML for anything it left empty ---
+    live = _sensor_snapshot() or {}
+    for key, gpu_key in _SENSOR_GPU_FIELDS:
+        setattr(gpu, gpu_key, live.get(key))
+    if any(live.get(key) is None for key, _ in _SENSOR_GPU_FIELDS):
+        # Daemon not running, or it could not read some counters: query directly
+        for gpu_key, value in (_read_gpu_live() or {}).items():
+            if getattr(gpu, gpu_key) is None:
+                setattr(gpu, gpu_key, value)
+
+    # --- NVML: identity, VRAM size, fan, driver and PCIe link ---
+    nvml_handle = _nvml_handle()
+    nvml_ok = nvml_handle is not None
+    if nvml_ok:
+        nvml, h = nvml_handle
+        try:
+            name = _nvml_call(nvml.nvmlDeviceGetName, h)
+            if isinstance(name, bytes):  # older bindings return bytes
+                name = name.decode(errors="replace")
+            gpu.model_name = name or gpu.model_name
+            mem = _nvml_call(nvml.nvmlDeviceGetMemoryInfo, h)
+            if mem:
+                gpu.vram_total_gb = _bytes_to_gb(mem.total)
+            gpu.fan_speed_pct = _safe_float(_nvml_call(nvml.nvmlDeviceGetFanSpeed, h))
+            drv = _nvml_call(nvml.nvmlSystemGetDriverVersion)
+            if isinstance(drv, bytes):
+                drv = drv.decode(errors="replace")
+            gpu.driver_version = drv or None
+            gpu.pcie_generation = _safe_int(_nvml_call(nvml.nvmlDeviceGetCurrPcieLinkGeneration, h))
+            gpu.pcie_link_width = _safe_int(_nvml_call(nvml.nvmlDeviceGetCurrPcieLinkWidth, h))
+        except Exception as e:
+            logging.debug("NVML GPU query failed: %s", e)
+
+    # --- GPUtil (spawns nvidia-smi itself, so only without NVML) ---
+    if not nvml_ok:
+        try:
+            if GPUtil:
+                gpus = GPUtil.getGPUs()
+                if gpus:
+                    g = gpus[0]
+                    gpu.model_name = g.name or gpu.model_name
+                    gpu.vram_total_gb = round(g.memoryTotal / 1024, 2) if g.memoryTotal else None
+                    if gpu.vram_used_gb is None:
+                        gpu.vram_used_gb = round(g.memoryUsed / 1024, 2) if g.memoryUsed else None
+                    if gpu.current_temp_c is None:
+                        gpu.current_temp_c = g.temperature
+                    if gpu.gpu_utilization_pct is None:
+                        gpu.gpu_utilization_pct = g.load * 100 if g.load is not None else None
+                    gpu.driver_version = g.driver
+        except Exception:
+            pass
 
-    # --- nvidia-smi fallback / augment ---
-    try:
-        smi_query = (
-            "nvidia-smi --query-gpu="
-            "name,memory.total,memory.used,clocks.current.graphics,clocks.current.memory,"
-            "temperature.gpu,fan.speed,driver_version,utilization.gpu,pcie.link.gen.current,"
-            "pcie.link.width.current"
-            " --format=csv,noheader,nounits"
-        )
-        raw = _run_cmd(smi_query, timeout=10)
-        if raw:
-            parts = [p.strip() for p in raw.split(",")]
-            if len(parts) >= 11:
-                if gpu["model_name"] == "unavailable":
-                    gpu["model_name"] = parts[0]
-                if gpu["vram_total_gb"] is None:
-                    vram_mb = _safe_float(parts[1])
-                    if vram_mb:
-                        gpu["vram_total_gb"] = round(vram_mb / 1024, 2)
-                if gpu["vram_used_gb"] is None:
-                    vused_mb = _safe_float(parts[2])
-                    if vused_mb:
-                        gpu["vram_used_gb"] = round(vused_mb / 1024, 2)
-                if gpu["gpu_clock_mhz"] is None:
-                    gpu["gpu_clock_mhz"] = _safe_float(parts[3])
-                if gpu["memory_clock_mhz"] is None:
-                    gpu["memory_clock_mhz"] = _safe_float(parts[4])
-                if gpu["current_temp_c"] is None:
-                    gpu["current_temp_c"] = _safe_float(parts[5])
-                if gpu["fan_speed_pct"] is None:
-                    fan = _safe_float(parts[6])
-                    gpu["fan_speed_pct"] = fan
-                if gpu["driver_version"] is None:
-                    gpu["driver_version"] = parts[7] if parts[7] and parts[7] != "[N/A]" else None
-                if gpu["gpu_utilization_pct"] is None:
-                    gpu["gpu_utilization_pct"] = _safe_float(parts[8])
-                gen = parts[9] if len(parts) > 9 else None
-                width = parts[10] if len(parts) > 10 else None
-                gpu["pcie_generation"] = _safe_int(gen)
-                gpu["pcie_link_width"] = _safe_int(width)
-    except Exception:
-        pass
+    # --- nvidia-smi fallback / augment (no NVML binding installed) ---
+    if not nvml_ok:
+        try:
+            smi_query = (
+                "nvidia-smi --query-gpu="
+                "name,memory.total,memory.used,clocks.current.graphics,clocks.current.memory,"
+                "temperature.gpu,fan.speed,driver_version,utilization.gpu,pcie.link.gen.current,"
+                "pcie.link.width.current"
+                " --format=csv,noheader,nounits"
+            )
+            raw = _run_cmd(smi_query, timeout=10)
+            if raw:
+                parts = [p.strip() for p in raw.split(",")]
+                if len(parts) >= 11:
+                    if gpu.model_name == "unavailable":
+                        gpu.model_name = parts[0]
+                    if gpu.vram_total_gb is None:
+                        vram_mb = _safe_float(parts[1])
+                        if vram_mb:
+                            gpu.vram_total_gb = round(vram_mb / 1024, 2)
+                    if gpu.vram_used_gb is None:
+                        vused_mb = _safe_float(parts[2])
+                        if vused_mb:
+                            gpu.vram_used_gb = round(vused_mb / 1024, 2)
+                    if gpu.gpu_clock_mhz is None:
+                        gpu.gpu_clock_mhz = _safe_float(parts[3])
+                    if gpu.memory_clock_mhz is None:
+                        gpu.memory_clock_mhz = _safe_float(parts[4])
+                    if gpu.current_temp_c is None:
+                        gpu.current_temp_c = _safe_float(parts[5])
+                    if gpu.fan_speed_pct is None:
+                        fan = _safe_float(parts[6])
+                        gpu.fan_speed_pct = fan
+                    if gpu.driver_version is None:
+                        gpu.driver_version = parts[7] if parts[7] and parts[7] != "[N/A]" else None
+                    if gpu.gpu_utilization_pct is None:
+                        gpu.gpu_utilization_pct = _safe_float(parts[8])
+                    gen = parts[9] if len(parts) > 9 else None
+                    width = parts[10] if len(parts) > 10 else None
+                    gpu.pcie_generation = _safe_int(gen)
+                    gpu.pcie_link_width = _safe_int(width)
+        except Exception:
+            pass
 
     # --- WMI fallback for model/VRAM ---
-    if gpu["model_name"] == "unavailable":
+    if gpu.model_name == "unavailable":
         try:
             w = _get_wmi_conn()
             if w:
-                for vc in w.Win32_VideoController():
+                controllers = w.query("SELECT Name, AdapterRAM, DriverVersion FROM Win32_VideoController")
+                for vc in controllers:
                     name = getattr(vc, "Name", "")
                     # Prefer discrete GPU over integrated
-                    if any(k in name.upper() for k in ("NVIDIA", "AMD", "RADEON", "GEFORCE", "RTX", "GTX", "RX ")):
-                        gpu["model_name"] = name.strip()
+                    if _DISCRETE_GPU_RE.search(name.upper()):
+                        gpu.model_name = name.strip()
                         ram_bytes = _safe_int(getattr(vc, "AdapterRAM", None))
-                        if ram_bytes and gpu["vram_total_gb"] is None:
-                            gpu["vram_total_gb"] = round(ram_bytes / (1024 ** 3), 2)
+                        if ram_bytes and gpu.vram_total_gb is None:
+                            gpu.vram_total_gb = round(ram_bytes / (1024 ** 3), 2)
                         drv = getattr(vc, "DriverVersion", None)
-                        if drv and gpu["driver_version"] is None:
-                            gpu["driver_version"] = drv
+                        if drv and gpu.driver_version is None:
+                            gpu.driver_version = drv
                         break
                 else:
                     # No discrete found; take the first one
-                    for vc in w.Win32_VideoController():
-                        gpu["model_name"] = getattr(vc, "Name", gpu["model_name"]).strip()
+                    for vc in controllers:
+                        gpu.model_name = getattr(vc, "Name", gpu.model_name).strip()
                         ram_bytes = _safe_int(getattr(vc, "AdapterRAM", None))
-                        if ram_bytes and gpu["vram_total_gb"] is None:
-                            gpu["vram_total_gb"] = round(ram_bytes / (1024 ** 3), 2)
+                        if ram_bytes and gpu.vram_total_gb is None:
+                            gpu.vram_total_gb = round(ram_bytes / (1024 ** 3), 2)
                         drv = getattr(vc, "DriverVersion", None)
-                        if drv and gpu["driver_version"] is None:
-                            gpu["driver_version"] = drv
+                        if drv and gpu.driver_version is None:
+                            gpu.driver_version = drv
                         break
         except Exception:
             pass
 
-    # wmic fallback
-    if gpu["model_name"] == "unavailable":
+    # PowerShell fallback
+    if gpu.model_name == "unavailable":
         try:
-            raw = _run_cmd(["wmic", "path", "win32_videocontroller", "get", "Name,AdapterRAM,DriverVersion", "/format:list"])
-            rows = []
-            current: dict = {}
-            for line in raw.splitlines():
-                line = line.strip()
-                if "=" in line:
-                    key, _, value = line.partition("=")
-                    current[key.strip()] = value.strip()
-                elif not line and current:
-                    rows.append(current)
-                    current = {}
-            if current:
-                rows.append(current)
+            rows = _cim_query("Win32_VideoController", "Name,AdapterRAM,DriverVersion")
             if rows:
                 r = rows[0]
-                gpu["model_name"] = r.get("Name", gpu["model_name"])
+                gpu.model_name = r.get("Name") or gpu.model_name
                 ram = _safe_int(r.get("AdapterRAM"))
-                if ram and gpu["vram_total_gb"] is None:
-                    gpu["vram_total_gb"] = round(ram / (1024 ** 3), 2)
-                if gpu["driver_version"] is None:
-                    gpu["driver_version"] = r.get("DriverVersion")
+                if ram and gpu.vram_total_gb is None:
+                    gpu.vram_total_gb = round(ram / (1024 ** 3), 2)
+                if gpu.driver_version is None:
+                    gpu.driver_version = r.get("DriverVersion")
         except Exception:
             pass
 
-    return gpu
+    return _as_dict(gpu)
 
 
 # ---------------------------------------------------------------------------
 # RAM Detection
 # ---------------------------------------------------------------------------
 
-def scan_ram() -> dict:
+@lru_cache(maxsize=1)
+def _ram_static() -> MappingProxyType:
+    """Installed-stick metadata (speeds, slots, form factor), queried once per process."""
     ram = {
-        "total_gb": None,
         "speed_mhz": None,
         "rated_speed_mhz": None,
         "num_sticks": None,
         "num_slots": None,
         "channel_mode": None,
-        "form_factor": None,          # Will include DDR gen, e.g. "DIMM DDR4"
-        "timings": None,              # String like "16-18-18-38" or null
-        "current_used_gb": None,
-        "usage_percent": None,
+        "form_factor": None,
+        "timings": None,
     }
 
-    # --- psutil for totals ---
-    try:
-        if psutil:
-            mem = psutil.virtual_memory()
-            ram["total_gb"] = round(mem.total / (1024 ** 3), 2)
-            ram["current_used_gb"] = round(mem.used / (1024 ** 3), 2)
-            ram["usage_percent"] = mem.percent
-    except Exception:
-        pass
-
     # --- WMI: PhysicalMemory ---
     sticks_detected = []
     try:
         w = _get_wmi_conn()
         if w:
-            for stick in w.Win32_PhysicalMemory():
+            for stick in w.query(
+                "SELECT ConfiguredClockSpeed, Speed, Capacity, FormFactor, SMBIOSMemoryType "
+                "FROM Win32_PhysicalMemory"
+            ):
                 info = {}
                 speed = _safe_int(getattr(stick, "ConfiguredClockSpeed", None))
                 if speed is None:
@@ -516,31 +1263,36 @@ def scan_ram() -> dict:
                 cap = _safe_int(getattr(stick, "Capacity", None))
                 info["capacity_bytes"] = cap
                 ff_code = _safe_int(getattr(stick, "FormFactor", None))
-                form_map = {8: "DIMM", 12: "SODIMM"}
-                info["form_factor"] = form_map.get(ff_code, f"code_{ff_code}" if ff_code else "unavailable")
+                info["form_factor"] = _RAM_FORM_FACTORS.get(ff_code, f"code_{ff_code}" if ff_code else "unavailable")
                 # Detect DDR generation from SMBIOSMemoryType
                 mem_type = _safe_int(getattr(stick, "SMBIOSMemoryType", None))
-                ddr_map = {20: "DDR", 21: "DDR2", 22: "DDR2", 24: "DDR3", 26: "DDR4", 34: "DDR5"}
-                info["ddr_gen"] = ddr_map.get(mem_type)
+                info["ddr_gen"] = _SMBIOS_MEMORY_TYPES.get(mem_type)
                 sticks_detected.append(info)
 
             ram["num_sticks"] = len(sticks_detected)
             if sticks_detected:
-                speeds = [s["actual_speed"] for s in sticks_detected if s["actual_speed"]]
-                if speeds:
-                    ram["speed_mhz"] = min(speeds)
-                rated = [s["rated_speed"] for s in sticks_detected if s["rated_speed"]]
-                if rated:
-                    ram["rated_speed_mhz"] = max(rated)
-                ffs = [s["form_factor"] for s in sticks_detected if s["form_factor"] != "unavailable"]
-                ddr_gens = [s["ddr_gen"] for s in sticks_detected if s.get("ddr_gen")]
-                ff_str = ffs[0] if ffs else "DIMM"
-                ddr_str = ddr_gens[0] if ddr_gens else None
+                # One pass: slowest configured speed, fastest rated speed,
+                # first known form factor and DDR generation.
+                min_speed = max_rated = first_ff = ddr_str = None
+                for s in sticks_detected:
+                    sp = s["actual_speed"]
+                    if sp and (min_speed is None or sp < min_speed):
+                        min_speed = sp
+                    rs = s["rated_speed"]
+                    if rs and (max_rated is None or rs > max_rated):
+                        max_rated = rs
+                    if first_ff is None and s["form_factor"] != "unavailable":
+                        first_ff = s["form_factor"]
+                    if ddr_str is None and s["ddr_gen"]:
+                        ddr_str = s["ddr_gen"]
+                ram["speed_mhz"] = min_speed
+                ram["rated_speed_mhz"] = max_rated
+                ff_str = first_ff or "DIMM"
                 # Fallback: guess DDR gen from speed ONLY if SMBIOS type was unavailable.
                 # Don't override SMBIOS — high-speed DDR4 (4800+MHz OC) exists.
                 if not ddr_str:
                     actual = ram.get("speed_mhz")
-                    if actual and actual >= 5200:
+                    if actual and actual >= _DDR5_MIN_SPEED_MHZ:
                         # 5200+ is almost certainly DDR5 (DDR4 OC rarely exceeds 5000)
                         ddr_str = "DDR5"
                     elif actual and actual < 4000:
@@ -551,7 +1303,7 @@ def scan_ram() -> dict:
 
             # Slot count
             try:
-                arrays = w.Win32_PhysicalMemoryArray()
+                arrays = w.query("SELECT MemoryDevices FROM Win32_PhysicalMemoryArray")
                 if arrays:
                     total_slots = sum(_safe_int(getattr(a, "MemoryDevices", 0)) or 0 for a in arrays)
                     ram["num_slots"] = total_slots if total_slots > 0 else None
@@ -560,25 +1312,19 @@ def scan_ram() -> dict:
     except Exception:
         pass
 
-    # --- wmic fallback for sticks ---
+    # --- Get-CimInstance fallback for sticks ---
     if not sticks_detected:
         try:
-            rows = _wmic("memorychip", "Capacity,ConfiguredClockSpeed,Speed,FormFactor")
+            rows = _cim_query("Win32_PhysicalMemory", "Capacity,ConfiguredClockSpeed,Speed,FormFactor")
             if rows:
                 ram["num_sticks"] = len(rows)
-                speeds = []
-                rated_speeds = []
                 for r in rows:
-                    s = _safe_int(r.get("ConfiguredClockSpeed")) or _safe_int(r.get("Speed"))
-                    if s:
-                        speeds.append(s)
                     rs = _safe_int(r.get("Speed"))
-                    if rs:
-                        rated_speeds.append(rs)
-                if speeds:
-                    ram["speed_mhz"] = min(speeds)
-                if rated_speeds:
-                    ram["rated_speed_mhz"] = max(rated_speeds)
+                    sp = _safe_int(r.get("ConfiguredClockSpeed")) or rs
+                    if sp and (ram["speed_mhz"] is None or sp < ram["speed_mhz"]):
+                        ram["speed_mhz"] = sp
+                    if rs and (ram["rated_speed_mhz"] is None or rs > ram["rated_speed_mhz"]):
+                        ram["rated_speed_mhz"] = rs
         except Exception:
             pass
 
@@ -603,18 +1349,6 @@ def scan_ram() -> dict:
     else:
         ram["channel_mode"] = "unknown"
 
-    # --- Total fallback ---
-    if ram["total_gb"] is None:
-        try:
-            raw = _run_cmd("wmic computersystem get TotalPhysicalMemory /format:list")
-            for line in raw.splitlines():
-                if "TotalPhysicalMemory" in line:
-                    val = _safe_int(line.split("=")[-1].strip())
-                    if val:
-                        ram["total_gb"] = round(val / (1024 ** 3), 2)
-        except Exception:
-            pass
-
     # --- Timings via PowerShell (rare but worth trying) ---
     try:
         # Try reading from SMBIOS via WMI — timings not standard in Win32_PhysicalMemory
@@ -623,7 +1357,34 @@ def scan_ram() -> dict:
     except Exception:
         pass
 
-    return ram
+    return MappingProxyType(ram)
+
+
+def scan_ram() -> dict:
+    psutil = _get_psutil()
+    ram = RAMInfo(**_ram_static())
+
+    # --- psutil for totals ---
+    try:
+        if psutil:
+            mem = psutil.virtual_memory()
+            ram.total_gb = round(mem.total / (1024 ** 3), 2)
+            ram.current_used_gb = round(mem.used / (1024 ** 3), 2)
+            ram.usage_percent = mem.percent
+    except Exception:
+        pass
+
+    # --- Total fallback ---
+    if ram.total_gb is None:
+        try:
+            rows = _cim_query("Win32_ComputerSystem", "TotalPhysicalMemory")
+            val = _safe_int(rows[0].get("TotalPhysicalMemory")) if rows else None
+            if val:
+                ram.total_gb = round(val / (1024 ** 3), 2)
+        except Exception:
+            pass
+
+    return _as_dict(ram)
 
 
 # ---------------------------------------------------------------------------
@@ -631,6 +1392,7 @@ def scan_ram() -> dict:
 # ---------------------------------------------------------------------------
 
 def scan_storage() -> list[dict]:
+    psutil = _get_psutil()
     drives = []
 
     # --- psutil disk partitions + usage ---
@@ -652,6 +1414,13 @@ def scan_storage() -> list[dict]:
     except Exception:
         pass
 
+    # --- Storage-stack media / bus / health, keyed by disk number ---
+    try:
+        physical = _physical_disk_info()
+    except Exception as e:
+        logging.debug("MSFT_PhysicalDisk query failed: %s", e)
+        physical = {}
+
     # --- WMI: Win32_DiskDrive ---
     try:
         w = _get_wmi_conn()
@@ -659,127 +1428,128 @@ def scan_storage() -> list[dict]:
             boot_disk_index = None
             # Find boot disk
             try:
-                for part in w.Win32_DiskPartition():
-                    if getattr(part, "BootPartition", False):
-                        boot_disk_index = _safe_int(getattr(part, "DiskIndex", None))
-                        break
+                for part in w.query("SELECT DiskIndex FROM Win32_DiskPartition WHERE BootPartition = TRUE"):
+                    boot_disk_index = _safe_int(getattr(part, "DiskIndex", None))
+                    break
             except Exception:
                 pass
 
-            for disk in w.Win32_DiskDrive():
-                d = {
-                    "model": "unavailable",
-                    "type": "unavailable",
-                    "capacity_gb": None,
-                    "used_gb": None,
-                    "free_gb": None,
-                    "interface": "unavailable",
-                    "health_status": None,
-                    "is_boot_drive": False,
-                }
-                d["model"] = getattr(disk, "Model", "unavailable").strip()
+            # Disk -> drive letters, joined in Python from the association classes
+            # rather than two ASSOCIATORS OF round-trips per disk.
+            try:
+                disk_letters = _disk_drive_letters(w)
+            except Exception as e:
+                logging.debug("disk/partition association query failed: %s", e)
+                disk_letters = {}
+
+            for disk in w.query(
+                "SELECT DeviceID, Index, Model, Size, InterfaceType, MediaType FROM Win32_DiskDrive"
+            ):
+                d = DriveInfo()
+                d.model = getattr(disk, "Model", "unavailable").strip()
                 size_bytes = _safe_int(getattr(disk, "Size", None))
                 if size_bytes:
-                    d["capacity_gb"] = round(size_bytes / (1024 ** 3), 2)
+                    d.capacity_gb = round(size_bytes / (1024 ** 3), 2)
 
                 iface = getattr(disk, "InterfaceType", "") or ""
                 media = (getattr(disk, "MediaType", "") or "").upper()
-                model_upper = d["model"].upper()
+                model_upper = d.model.upper()
+                idx = _safe_int(getattr(disk, "Index", None))
+                media_type, bus_type, health = physical.get(idx, (None, None, None))
+                d.health_status = health
 
                 # Determine interface and type
-                if "NVME" in model_upper or "NVME" in iface.upper():
-                    d["interface"] = "NVMe"
-                    d["type"] = "NVMe SSD"
-                elif "SATA" in iface.upper() or "IDE" in iface.upper() or "SCSI" in iface.upper():
-                    d["interface"] = "SATA"
-                    if "SSD" in model_upper or "SOLID" in media:
-                        d["type"] = "SATA SSD"
-                    elif "FIXED" in media:
-                        # Could be SSD or HDD; heuristic: if no "HDD" or rotation keyword
-                        if any(k in model_upper for k in ("HDD", "BARRACUDA", "CAVIAR", "IRONWOLF", "WD BLUE WD10", "WD BLACK WD")):
-                            d["type"] = "HDD"
-                        else:
-                            d["type"] = "SATA SSD"
-                    else:
-                        d["type"] = "HDD"
+                if bus_type == _MSFT_BUS_NVME or "NVME" in model_upper or "NVME" in iface.upper():
+                    d.interface = "NVMe"
+                    d.type = "NVMe SSD"
                 else:
-                    d["interface"] = iface if iface else "unavailable"
+                    is_sata = "SATA" in iface.upper() or "IDE" in iface.upper() or "SCSI" in iface.upper()
+                    d.interface = "SATA" if is_sata else (iface if iface else "unavailable")
+                    # MSFT_PhysicalDisk MediaType is authoritative on any bus (USB, 1394, ...)
+                    if media_type == _MSFT_MEDIA_HDD:
+                        d.type = "HDD"
+                    elif media_type in _MSFT_MEDIA_SSD:
+                        d.type = "SATA SSD"
+                    elif is_sata:
+                        # MediaType unknown: fall back to guessing from the model name
+                        if "SSD" in model_upper or "SOLID" in media:
+                            d.type = "SATA SSD"
+                        elif "FIXED" in media:
+                            d.type = "HDD" if _HDD_MODEL_RE.search(model_upper) else "SATA SSD"
+                        else:
+                            d.type = "HDD"
 
                 # Check if boot
-                idx = _safe_int(getattr(disk, "Index", None))
                 if idx is not None and idx == boot_disk_index:
-                    d["is_boot_drive"] = True
+                    d.is_boot_drive = True
 
                 # Map partitions for usage data
-                try:
-                    for assoc in disk.associators(wmi_result_class="Win32_DiskPartition"):
-                        for logical in assoc.associators(wmi_result_class="Win32_LogicalDisk"):
-                            device_id = getattr(logical, "DeviceID", "")
-                            for pdev, pinfo in partition_map.items():
-                                if device_id and pdev.startswith(device_id):
-                                    d["used_gb"] = pinfo.get("used_gb")
-                                    d["free_gb"] = pinfo.get("free_gb")
-                                    if d["capacity_gb"] is None:
-                                        d["capacity_gb"] = pinfo.get("capacity_gb")
-                except Exception:
-                    pass
+                for device_id in disk_letters.get(getattr(disk, "DeviceID", ""), ()):
+                    for pdev, pinfo in partition_map.items():
+                        if device_id and pdev.startswith(device_id):
+                            d.used_gb = pinfo.get("used_gb")
+                            d.free_gb = pinfo.get("free_gb")
+                            if d.capacity_gb is None:
+                                d.capacity_gb = pinfo.get("capacity_gb")
 
                 drives.append(d)
     except Exception:
         pass
 
-    # --- wmic fallback ---
+    # --- Get-CimInstance fallback ---
     if not drives:
         try:
-            rows = _wmic("diskdrive", "Model,Size,InterfaceType,Index,MediaType")
+            rows = _cim_query("Win32_DiskDrive", "Model,Size,InterfaceType,Index,MediaType")
             for r in rows:
-                d = {
-                    "model": r.get("Model", "unavailable"),
-                    "type": "unavailable",
-                    "capacity_gb": None,
-                    "used_gb": None,
-                    "free_gb": None,
-                    "interface": r.get("InterfaceType", "unavailable"),
-                    "health_status": None,
-                    "is_boot_drive": False,
-                }
+                d = DriveInfo(
+                    model=(r.get("Model") or "unavailable").strip(),
+                    interface=r.get("InterfaceType") or "unavailable",
+                )
                 size = _safe_int(r.get("Size"))
                 if size:
-                    d["capacity_gb"] = round(size / (1024 ** 3), 2)
+                    d.capacity_gb = round(size / (1024 ** 3), 2)
                 drives.append(d)
         except Exception:
             pass
 
-    # --- Health via PowerShell Get-PhysicalDisk ---
+    # --- Health via PowerShell Get-PhysicalDisk, only without MSFT_PhysicalDisk ---
     try:
-        raw = _run_powershell(
-            "Get-PhysicalDisk | Select-Object FriendlyName,HealthStatus,MediaType,BusType | ConvertTo-Json"
-        )
-        if raw:
-            pdata = json.loads(raw)
-            if isinstance(pdata, dict):
-                pdata = [pdata]
+        pdata = _ps_rows(
+            "Get-PhysicalDisk -ErrorAction SilentlyContinue | "
+            "Select-Object FriendlyName,HealthStatus,MediaType,BusType | ConvertTo-Json -Compress"
+        ) if not physical else None
+        if pdata:
+            drives_by_model = {d.model.upper().strip(): d for d in drives}
             for pd in pdata:
                 fname = (pd.get("FriendlyName") or "").strip().upper()
-                health = pd.get("HealthStatus", "")
+                if not fname:
+                    continue
+                # Exact model match first, then the old substring match either way
+                d = drives_by_model.get(fname) or next(
+                    (dr for k, dr in drives_by_model.items() if k and (k in fname or fname in k)),
+                    None,
+                )
+                if d is None:
+                    continue
+                health = pd.get("HealthStatus")
                 media_type = pd.get("MediaType", "")
                 bus_type = pd.get("BusType", "")
-                for d in drives:
-                    if d["model"].upper().strip() in fname or fname in d["model"].upper().strip():
-                        d["health_status"] = health if health else None
-                        # Refine type using PowerShell MediaType
-                        if media_type:
-                            mt = str(media_type).upper()
-                            bt = str(bus_type).upper()
-                            if "SSD" in mt or mt == "4":
-                                if "NVME" in bt or bt == "17":
-                                    d["type"] = "NVMe SSD"
-                                    d["interface"] = "NVMe"
-                                else:
-                                    d["type"] = "SATA SSD"
-                            elif "HDD" in mt or mt == "3":
-                                d["type"] = "HDD"
-                        break
+                # ConvertTo-Json writes the enum as a number (0 = Healthy)
+                if isinstance(health, int):
+                    health = _MSFT_HEALTH.get(health)
+                d.health_status = health if health else None
+                # Refine type using PowerShell MediaType
+                if media_type:
+                    mt = str(media_type).upper()
+                    bt = str(bus_type).upper()
+                    if "SSD" in mt or mt == "4":
+                        if "NVME" in bt or bt == "17":
+                            d.type = "NVMe SSD"
+                            d.interface = "NVMe"
+                        else:
+                            d.type = "SATA SSD"
+                    elif "HDD" in mt or mt == "3":
+                        d.type = "HDD"
     except Exception:
         pass
 
@@ -788,18 +1558,81 @@ def scan_storage() -> list[dict]:
         # Simple: assign first partition to first drive if only one drive
         if len(drives) == 1 and partition_map:
             first_part = list(partition_map.values())[0]
-            if drives[0]["used_gb"] is None:
-                drives[0]["used_gb"] = first_part.get("used_gb")
-                drives[0]["free_gb"] = first_part.get("free_gb")
+            if drives[0].used_gb is None:
+                drives[0].used_gb = first_part.get("used_gb")
+                drives[0].free_gb = first_part.get("free_gb")
 
-    return drives
+    return [_as_dict(d) for d in drives]
 
 
 # ---------------------------------------------------------------------------
 # Motherboard Detection
 # ---------------------------------------------------------------------------
 
-def scan_motherboard() -> dict:
+_SMBIOS_RSMB = 0x52534D42  # 'RSMB' firmware table provider
+_SMBIOS_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2,4})")  # mm/dd/yyyy
+
+
+def _parse_smbios(data: bytes) -> dict:
+    """Pull BIOS (type 0) and baseboard (type 2) strings out of raw SMBIOS structures."""
+    found = {}
+    pos = 0
+    while pos + 4 <= len(data):
+        stype, slen = data[pos], data[pos + 1]
+        if slen < 4:
+            break
+        # Formatted area, then NUL-terminated strings ending in a double NUL
+        end = data.find(b"\0\0", pos + slen)
+        if end < 0:
+            break
+        strings = data[pos + slen:end].split(b"\0")
+
+        def string_at(offset, pos=pos, slen=slen, strings=strings):
+            idx = data[pos + offset] if offset < slen else 0
+            if 0 < idx <= len(strings):
+                return strings[idx - 1].decode("ascii", errors="replace").strip()
+            return ""
+
+        if stype == 0 and "bios_version" not in found:
+            found["bios_version"] = string_at(5)
+            m = _SMBIOS_DATE_RE.match(string_at(8))
+            if m:
+                year = m.group(3) if len(m.group(3)) == 4 else f"19{m.group(3)}"
+                found["bios_date"] = f"{year}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
+        elif stype == 2 and "board_product" not in found:
+            found["board_manufacturer"] = string_at(4)
+            found["board_product"] = string_at(5)
+        elif stype == 127:  # end-of-table
+            break
+        pos = end + 2
+    return found
+
+
+@lru_cache(maxsize=1)
+def _smbios_info() -> MappingProxyType:
+    """Board / BIOS identity from GetSystemFirmwareTable — no WMI or subprocess."""
+    try:
+        import ctypes
+
+        get_table = ctypes.windll.kernel32.GetSystemFirmwareTable
+    except (ImportError, AttributeError, OSError):
+        return MappingProxyType({})
+    get_table.argtypes = [ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32]
+    get_table.restype = ctypes.c_uint32
+    size = get_table(_SMBIOS_RSMB, 0, None, 0)
+    if not size:
+        return MappingProxyType({})
+    buf = ctypes.create_string_buffer(size)
+    if get_table(_SMBIOS_RSMB, 0, buf, size) != size:
+        return MappingProxyType({})
+    # RawSMBIOSData: 4 version bytes, DWORD table length, then the structures
+    (length,) = struct.unpack_from("<I", buf.raw, 4)
+    return MappingProxyType(_parse_smbios(buf.raw[8:8 + length]))
+
+
+@lru_cache(maxsize=1)
+def _motherboard_static() -> MappingProxyType:
+    """Board, chipset and BIOS identity — static for the whole boot, queried once."""
     mb = {
         "model": "unavailable",
         "chipset": None,
@@ -811,49 +1644,66 @@ def scan_motherboard() -> dict:
     try:
         w = _get_wmi_conn()
         if w:
-            for board in w.Win32_BaseBoard():
+            for board in w.query("SELECT Manufacturer, Product FROM Win32_BaseBoard"):
                 mfr = (getattr(board, "Manufacturer", "") or "").strip()
                 prod = (getattr(board, "Product", "") or "").strip()
                 mb["model"] = f"{mfr} {prod}".strip() if (mfr or prod) else "unavailable"
                 break
-            for bios in w.Win32_BIOS():
+            for bios in w.query("SELECT SMBIOSBIOSVersion, Version, ReleaseDate FROM Win32_BIOS"):
                 mb["bios_version"] = (getattr(bios, "SMBIOSBIOSVersion", "") or getattr(bios, "Version", "") or "").strip()
                 date_raw = getattr(bios, "ReleaseDate", "")
                 if date_raw:
-                    # WMI date format: 20230101000000.000000+000
-                    m = re.match(r"(\d{4})(\d{2})(\d{2})", str(date_raw))
+                    m = _WMI_DATE_RE.match(str(date_raw))
                     if m:
                         mb["bios_date"] = f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
                 break
     except Exception:
         pass
 
-    # --- wmic fallback ---
+    # --- Raw SMBIOS table fallback ---
+    if mb["model"] == "unavailable" or mb["bios_version"] == "unavailable":
+        try:
+            smbios = _smbios_info()
+            if mb["model"] == "unavailable":
+                board = f"{smbios.get('board_manufacturer', '')} {smbios.get('board_product', '')}".strip()
+                if board:
+                    mb["model"] = board
+            if mb["bios_version"] == "unavailable" and smbios.get("bios_version"):
+                mb["bios_version"] = smbios["bios_version"]
+                if mb["bios_date"] is None:
+                    mb["bios_date"] = smbios.get("bios_date")
+        except Exception:
+            pass
+
+    # --- PowerShell fallback ---
     if mb["model"] == "unavailable":
         try:
-            rows = _wmic("baseboard", "Manufacturer,Product")
+            rows = _cim_query("Win32_BaseBoard", "Manufacturer,Product")
             if rows:
-                mfr = rows[0].get("Manufacturer", "")
-                prod = rows[0].get("Product", "")
-                mb["model"] = f"{mfr} {prod}".strip()
+                mfr = (rows[0].get("Manufacturer") or "").strip()
+                prod = (rows[0].get("Product") or "").strip()
+                mb["model"] = f"{mfr} {prod}".strip() or "unavailable"
         except Exception:
             pass
 
     if mb["bios_version"] == "unavailable":
         try:
-            rows = _wmic("bios", "SMBIOSBIOSVersion,ReleaseDate")
+            rows = _ps_rows(
+                "Get-CimInstance Win32_BIOS -ErrorAction SilentlyContinue | Select-Object SMBIOSBIOSVersion,"
+                "@{n='ReleaseDate';e={$_.ReleaseDate.ToString('yyyyMMdd')}} | ConvertTo-Json -Compress"
+            )
             if rows:
-                mb["bios_version"] = rows[0].get("SMBIOSBIOSVersion", "unavailable")
+                mb["bios_version"] = rows[0].get("SMBIOSBIOSVersion") or "unavailable"
+                m = _WMI_DATE_RE.match(str(rows[0].get("ReleaseDate") or ""))
+                if m and mb["bios_date"] is None:
+                    mb["bios_date"] = f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
         except Exception:
             pass
 
-    # --- Chipset via registry or WMI ---
+    # --- Chipset via registry (from the PowerShell bundle) ---
     try:
-        raw = _run_powershell(
-            "(Get-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Enum\\PCI\\*\\*' -Name DeviceDesc -ErrorAction SilentlyContinue | "
-            "Where-Object { $_.DeviceDesc -match 'chipset|ISA|LPC|SMBus' } | Select-Object -First 1).DeviceDesc"
-        )
-        if raw:
+        raw = _powershell_bundle().get("chipset")
+        if isinstance(raw, str) and raw:
             # Format: @...; description or just description
             chipset = raw.split(";")[-1].strip() if ";" in raw else raw.strip()
             if chipset:
@@ -861,7 +1711,11 @@ def scan_motherboard() -> dict:
     except Exception:
         pass
 
-    return mb
+    return MappingProxyType(mb)
+
+
+def scan_motherboard() -> dict:
+    return _as_dict(MotherboardInfo(**_motherboard_static()))
 
 
 # ---------------------------------------------------------------------------
@@ -869,88 +1723,72 @@ def scan_motherboard() -> dict:
 # ---------------------------------------------------------------------------
 
 def scan_os() -> dict:
-    os_info = {
-        "windows_version": "unavailable",
-        "build_number": None,
-        "is_up_to_date": None,
-        "power_plan": None,
-        "game_mode": None,
-        "hw_accelerated_gpu_scheduling": None,
-        "virtual_memory_gb": None,
-    }
+    psutil = _get_psutil()
+    os_info = OSInfo()
 
     # --- Basic version ---
     try:
-        ver = platform.version()
-        release = platform.release()
-        edition = platform.win32_edition() if hasattr(platform, "win32_edition") else ""
-        os_info["windows_version"] = f"Windows {release}" + (f" {edition}" if edition else "")
-        os_info["build_number"] = ver
+        plat = _platform_info()
+        ver, release, edition = plat["version"], plat["release"], plat["edition"]
+        os_info.windows_version = f"Windows {release}" + (f" {edition}" if edition else "")
+        os_info.build_number = ver
     except Exception:
         pass
 
     # Refine: detect W11 vs W10 via build
     try:
-        build_str = os_info["build_number"] or ""
+        build_str = os_info.build_number or ""
         build_num = _safe_int(build_str.split(".")[0])
-        if build_num and build_num >= 22000 and "11" not in os_info["windows_version"]:
-            os_info["windows_version"] = os_info["windows_version"].replace("Windows 10", "Windows 11")
+        if build_num and build_num >= 22000 and "11" not in os_info.windows_version:
+            os_info.windows_version = os_info.windows_version.replace("Windows 10", "Windows 11")
     except Exception:
         pass
 
     # Display version (23H2 etc)
     try:
-        dv = _run_powershell(
-            "(Get-ItemProperty -Path 'HKLM:\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion' -Name DisplayVersion -ErrorAction SilentlyContinue).DisplayVersion"
-        )
+        dv = _reg_read("HKEY_LOCAL_MACHINE", r"SOFTWARE\Microsoft\Windows NT\CurrentVersion", "DisplayVersion")
         if dv:
-            os_info["windows_version"] += f" {dv}"
+            os_info.windows_version += f" {dv}"
     except Exception:
         pass
 
     # --- Power plan ---
     try:
-        raw = _run_cmd("powercfg /getactivescheme")
+        raw = _run_cmd_oneline(("powercfg", "/getactivescheme"))
         if raw:
             # Format: Power Scheme GUID: ... (Plan Name)
-            m = re.search(r"\((.+)\)", raw)
+            m = _POWER_PLAN_RE.search(raw)
             if m:
-                os_info["power_plan"] = m.group(1)
+                os_info.power_plan = m.group(1)
     except Exception:
         pass
 
     # --- Game Mode ---
     try:
-        gm = _run_powershell(
-            "(Get-ItemProperty -Path 'HKCU:\\Software\\Microsoft\\GameBar' -Name AllowAutoGameMode -ErrorAction SilentlyContinue).AllowAutoGameMode"
-        )
-        if gm == "1" or gm == "":
-            os_info["game_mode"] = True
-        elif gm == "0":
-            os_info["game_mode"] = False
+        gm = _reg_read("HKEY_CURRENT_USER", r"Software\Microsoft\GameBar", "AllowAutoGameMode")
+        if gm == 1 or gm is None:
+            os_info.game_mode = True
+        elif gm == 0:
+            os_info.game_mode = False
         else:
             # Default is ON if key doesn't exist
-            auto = _run_powershell(
-                "(Get-ItemProperty -Path 'HKCU:\\Software\\Microsoft\\GameBar' -Name AutoGameModeEnabled -ErrorAction SilentlyContinue).AutoGameModeEnabled"
-            )
-            if auto == "1" or auto == "":
-                os_info["game_mode"] = True
-            elif auto == "0":
-                os_info["game_mode"] = False
+            auto = _reg_read("HKEY_CURRENT_USER", r"Software\Microsoft\GameBar", "AutoGameModeEnabled")
+            if auto == 1 or auto is None:
+                os_info.game_mode = True
+            elif auto == 0:
+                os_info.game_mode = False
             else:
-                os_info["game_mode"] = True  # Default on in modern Windows
+                os_info.game_mode = True  # Default on in modern Windows
     except Exception:
         pass
 
     # --- HW-accelerated GPU scheduling ---
     try:
-        hags = _run_powershell(
-            "(Get-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\GraphicsDrivers' -Name HwSchMode -ErrorAction SilentlyContinue).HwSchMode"
-        )
-        if hags == "2":
-            os_info["hw_accelerated_gpu_scheduling"] = True
-        elif hags in ("1", "0"):
-            os_info["hw_accelerated_gpu_scheduling"] = False
+        hags = _reg_read("HKEY_LOCAL_MACHINE", r"SYSTEM\CurrentControlSet\Control\GraphicsDrivers", "HwSchMode")
+        if hags == 2:
+            os_info.hw_accelerated_gpu_scheduling = True
+        elif hags in (1, 0):
+            os_info.hw_accelerated_gpu_scheduling = False
     except Exception:
         pass
 
@@ -958,85 +1796,117 @@ def scan_os() -> dict:
     try:
         if psutil:
             swap = psutil.swap_memory()
-            os_info["virtual_memory_gb"] = round(swap.total / (1024 ** 3), 2)
+            os_info.virtual_memory_gb = round(swap.total / (1024 ** 3), 2)
     except Exception:
         pass
 
-    return os_info
+    return _as_dict(os_info)
 
 
 # ---------------------------------------------------------------------------
 # Network Detection
 # ---------------------------------------------------------------------------
 
+def _icmp_ping_ms(host: str, timeout_ms: int = 3000) -> float | None:
+    """Round-trip time of one ICMP echo, in ms, via IcmpSendEcho (no admin, no subprocess)."""
+    iphlpapi = _get_iphlpapi()
+    if iphlpapi is None:
+        return None
+    import ctypes
+    import socket
+
+    try:
+        # IPAddr is the address in network byte order read as a native DWORD
+        addr = int.from_bytes(socket.inet_aton(host), "little")
+    except OSError:
+        return None
+    handle = iphlpapi.IcmpCreateFile()
+    if not handle or handle == ctypes.c_void_p(-1).value:
+        return None
+    try:
+        payload = b"pc-bottleneck-analyzer"
+        reply = ctypes.create_string_buffer(256)  # ICMP_ECHO_REPLY + payload + error slack
+        if iphlpapi.IcmpSendEcho(handle, addr, payload, len(payload), None, reply, len(reply), timeout_ms):
+            # ICMP_ECHO_REPLY starts with Address, Status, RoundTripTime (ULONGs)
+            _, status, rtt = struct.unpack_from("<LLL", reply.raw)
+            if status == 0:  # IP_SUCCESS
+                # Whole ms; report sub-ms replies as 1 like ping.exe's "time<1ms"
+                return float(max(rtt, 1))
+    finally:
+        iphlpapi.IcmpCloseHandle(handle)
+    return None
+
+
 def scan_network() -> dict:
-    net = {
-        "connection_type": "unavailable",
-        "speed_mbps": None,
-        "latency_ms": None,
-    }
+    psutil = _get_psutil()
+    net = NetworkInfo()
 
     # --- Connection type & speed ---
     try:
         w = _get_wmi_conn()
         if w:
-            for adapter in w.Win32_NetworkAdapter():
-                connected = getattr(adapter, "NetConnectionStatus", None)
-                if connected == 2:  # Connected
-                    name = (getattr(adapter, "Name", "") or "").upper()
-                    speed = _safe_int(getattr(adapter, "Speed", None))
-                    adapter_type = getattr(adapter, "AdapterType", "") or ""
-
-                    if any(k in name for k in ("WI-FI", "WIFI", "WIRELESS", "WLAN", "802.11")):
-                        net["connection_type"] = "WiFi"
-                    elif any(k in name for k in ("ETHERNET", "LAN", "REALTEK", "INTEL I", "KILLER")):
-                        net["connection_type"] = "Ethernet"
-                    elif "802.3" in adapter_type:
-                        net["connection_type"] = "Ethernet"
-                    else:
-                        net["connection_type"] = adapter_type if adapter_type else "Wired"
-
-                    if speed:
-                        net["speed_mbps"] = round(speed / 1_000_000)
-                    break
+            # Only connected adapters (NetConnectionStatus 2), only the columns we read
+            for adapter in w.query(
+                "SELECT Name, Speed, AdapterType FROM Win32_NetworkAdapter WHERE NetConnectionStatus = 2"
+            ):
+                name = (getattr(adapter, "Name", "") or "").upper()
+                speed = _safe_int(getattr(adapter, "Speed", None))
+                adapter_type = getattr(adapter, "AdapterType", "") or ""
+
+                if _WIFI_RE.search(name):
+                    net.connection_type = "WiFi"
+                elif _ETH_RE.search(name):
+                    net.connection_type = "Ethernet"
+                elif "802.3" in adapter_type:
+                    net.connection_type = "Ethernet"
+                else:
+                    net.connection_type = adapter_type if adapter_type else "Wired"
+
+                if speed:
+                    net.speed_mbps = round(speed / 1_000_000)
+                break
     except Exception:
         pass
 
     # psutil fallback
-    if net["connection_type"] == "unavailable":
+    if net.connection_type == "unavailable":
         try:
             if psutil:
                 stats = psutil.net_if_stats()
                 for iface, snic in stats.items():
                     if snic.isup and snic.speed > 0:
                         upper = iface.upper()
-                        if any(k in upper for k in ("WI-FI", "WIFI", "WIRELESS", "WLAN")):
-                            net["connection_type"] = "WiFi"
-                        elif any(k in upper for k in ("ETH", "LAN", "REALTEK", "INTEL")):
-                            net["connection_type"] = "Ethernet"
+                        if _WIFI_RE.search(upper):
+                            net.connection_type = "WiFi"
+                        elif _ETH_IFACE_RE.search(upper):
+                            net.connection_type = "Ethernet"
                         else:
-                            net["connection_type"] = "Connected"
-                        net["speed_mbps"] = snic.speed
+                            net.connection_type = "Connected"
+                        net.speed_mbps = snic.speed
                         break
         except Exception:
             pass
 
     # --- Latency (ping 8.8.8.8) ---
-    try:
-        raw = _run_cmd("ping -n 1 -w 3000 8.8.8.8", timeout=8)
-        if raw:
-            m = re.search(r"Average\s*=\s*(\d+)", raw)
-            if m:
-                net["latency_ms"] = _safe_float(m.group(1))
-            else:
-                # Try "time=XXms" or "time<1ms"
-                m2 = re.search(r"time[=<](\d+)", raw)
-                if m2:
-                    net["latency_ms"] = _safe_float(m2.group(1))
-    except Exception:
-        pass
+    if _get_iphlpapi() is not None:
+        net.latency_ms = _icmp_ping_ms("8.8.8.8", timeout_ms=3000)
+    else:
+        # ping.exe fallback when iphlpapi can't be loaded
+        try:
+            raw = _run_cmd("ping -n 1 -w 3000 8.8.8.8", timeout=8)
+            if raw:
+                m = _PING_AVG_RE.search(raw)
+                if m:
+                    net.latency_ms = _safe_float(m.group(1))
+                else:
+                    # Try "time=XXms" or "time<1ms"
+                    m2 = _PING_TIME_RE.search(raw)
+                    if m2:
+                        net.latency_ms = _safe_float(m2.group(1))
+        except Exception:
+            pass
 
-    return net
+    return _as_dict(net)
 
 
 # ---------------------------------------------------------------------------
@@ -1044,13 +1914,7 @@ def scan_network() -> dict:
 # ---------------------------------------------------------------------------
 
 def scan_bios_settings(ram_info: dict) -> dict:
-    bios = {
-        "xmp_enabled": None,
-        "resizable_bar": None,
-        "tpm_status": None,
-        "virtualization": None,
-        "secure_boot": None,
-    }
+    bios = BIOSSettings()
 
     # --- XMP detection heuristic ---
     actual = ram_info.get("speed_mhz")
@@ -1059,84 +1923,80 @@ def scan_bios_settings(ram_info: dict) -> dict:
         # If actual speed is significantly lower than rated, XMP is likely off
         # JEDEC defaults: DDR4=2133/2400, DDR5=4800
         if actual >= rated * 0.95:
-            bios["xmp_enabled"] = True
+            bios.xmp_enabled = True
         elif actual < rated * 0.8:
-            bios["xmp_enabled"] = False
+            bios.xmp_enabled = False
         else:
-            bios["xmp_enabled"] = None  # Ambiguous
+            bios.xmp_enabled = None  # Ambiguous
 
-    # --- Resizable BAR ---
+    # --- Resizable BAR (any display adapter instance with a ReBarState value) ---
     try:
-        rebar = _run_powershell(
-            "Get-ItemProperty -Path 'HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Class\\{4d36e968-e325-11ce-bfc1-08002be10318}\\0*' "
-            "-Name 'ReBarState' -ErrorAction SilentlyContinue | Select-Object -ExpandProperty ReBarState"
-        )
-        if rebar:
-            bios["resizable_bar"] = True
+        if any(
+            _reg_read("HKEY_LOCAL_MACHINE", rf"{_DISPLAY_CLASS_KEY}\{sub}", "ReBarState") is not None
+            for sub in _reg_subkeys("HKEY_LOCAL_MACHINE", _DISPLAY_CLASS_KEY)
+            if sub.startswith("0")
+        ):
+            bios.resizable_bar = True
     except Exception:
         pass
 
-    if bios["resizable_bar"] is None:
-        try:
-            smi = _run_cmd("nvidia-smi --query-gpu=pci.sub_device_id --format=csv,noheader", timeout=5)
-            # Check for rebar via nvidia-smi BAR1 memory
-            bar1_raw = _run_cmd(
-                "nvidia-smi --query-gpu=bar1.total --format=csv,noheader,nounits", timeout=5
-            )
-            bar1 = _safe_float(bar1_raw)
-            if bar1 and bar1 > 256:
-                bios["resizable_bar"] = True
-            elif bar1:
-                bios["resizable_bar"] = False
-        except Exception:
-            pass
+    if bios.resizable_bar is None:
+        # Check for rebar via the BAR1 aperture size (MiB): NVML, else nvidia-smi
+        bar1 = None
+        nvml_handle = _nvml_handle()
+        if nvml_handle is not None:
+            nvml, h = nvml_handle
+            info = _nvml_call(nvml.nvmlDeviceGetBAR1MemoryInfo, h)
+            if info:
+                bar1 = info.bar1Total / (1024 ** 2)
+        if bar1 is None:
+            try:
+                bar1 = _safe_float(_run_cmd_oneline(
+                    ("nvidia-smi", "--query-gpu=bar1.total", "--format=csv,noheader,nounits"), timeout=5
+                ))
+            except Exception:
+                pass
+        if bar1 and bar1 > 256:
+            bios.resizable_bar = True
+        elif bar1:
+            bios.resizable_bar = False
 
     # --- TPM ---
-    try:
-        tpm = _run_powershell(
-            "(Get-Tpm -ErrorAction SilentlyContinue).TpmPresent"
-        )
-        if tpm.upper() == "TRUE":
-            bios["tpm_status"] = "enabled"
-        elif tpm.upper() == "FALSE":
-            bios["tpm_status"] = "not present"
-    except Exception:
-        pass
+    tpm = _powershell_bundle().get("tpm_present")
+    if tpm is True:
+        bios.tpm_status = "enabled"
+    elif tpm is False:
+        bios.tpm_status = "not present"
 
-    if bios["tpm_status"] is None:
+    if bios.tpm_status is None:
         try:
-            tpm_wmi = _run_powershell(
-                "Get-CimInstance -Namespace 'root\\cimv2\\Security\\MicrosoftTpm' -ClassName Win32_Tpm -ErrorAction SilentlyContinue | "
-                "Select-Object -ExpandProperty IsEnabled_InitialValue"
-            )
-            if tpm_wmi.upper() == "TRUE":
-                bios["tpm_status"] = "enabled"
+            conn = _get_wmi_namespace("tpm")  # admin only
+            if conn:
+                for t in conn.query("SELECT IsEnabled_InitialValue FROM Win32_Tpm"):
+                    if getattr(t, "IsEnabled_InitialValue", None) is True:
+                        bios.tpm_status = "enabled"
+                    break
         except Exception:
             pass
 
     # --- Virtualization ---
     try:
-        virt = _run_powershell(
-            "(Get-CimInstance -ClassName Win32_Processor -ErrorAction SilentlyContinue).VirtualizationFirmwareEnabled"
-        )
-        if virt.upper() == "TRUE":
-            bios["virtualization"] = True
-        elif virt.upper() == "FALSE":
-            bios["virtualization"] = False
+        w = _get_wmi_conn()
+        if w:
+            for proc in w.query("SELECT VirtualizationFirmwareEnabled FROM Win32_Processor"):
+                virt = getattr(proc, "VirtualizationFirmwareEnabled", None)
+                if isinstance(virt, bool):
+                    bios.virtualization = virt
+                break
     except Exception:
         pass
 
-    # --- Secure Boot ---
-    try:
-        sb = _run_powershell("Confirm-SecureBootUEFI -ErrorAction SilentlyContinue")
-        if sb.upper() == "TRUE":
-            bios["secure_boot"] = True
-        elif sb.upper() == "FALSE":
-            bios["secure_boot"] = False
-    except Exception:
-        pass
+    # --- Secure Boot (key is absent on legacy-BIOS systems) ---
+    sb = _reg_read("HKEY_LOCAL_MACHINE", r"SYSTEM\CurrentControlSet\Control\SecureBoot\State", "UEFISecureBootEnabled")
+    if sb in (0, 1):
+        bios.secure_boot = bool(sb)
 
-    return bios
+    return _as_dict(bios)
 
 
 # ---------------------------------------------------------------------------
@@ -1147,9 +2007,17 @@ def detect_issues(cpu, gpu, ram, storage, os_info, bios_settings) -> list[str]:
     """Analyze collected data and return a list of potential issues / warnings."""
     issues = []
 
+    # Pull every field the checks below need once, up front
+    actual_speed, rated_speed = ram.get("speed_mhz"), ram.get("rated_speed_mhz")
+    ram_usage = ram.get("usage_percent")
+    cpu_temp, gpu_temp = cpu.get("current_temp_c"), gpu.get("current_temp_c")
+    vram = gpu.get("vram_total_gb")
+    gpu_name = (gpu.get("model_name") or "").upper()
+    power_plan = os_info.get("power_plan", "") or ""
+    power_plan_lower = power_plan.lower()
+    boot_drives = [d for d in storage if d.get("is_boot_drive")]
+
     # 1. XMP not enabled
-    actual_speed = ram.get("speed_mhz")
-    rated_speed = ram.get("rated_speed_mhz")
     if actual_speed and rated_speed and actual_speed < rated_speed * 0.9:
         issues.append(
             f"RAM running at {actual_speed}MHz but rated for {rated_speed}MHz "
@@ -1157,8 +2025,7 @@ def detect_issues(cpu, gpu, ram, storage, os_info, bios_settings) -> list[str]:
         )
 
     # 2. Power plan not High Performance
-    power_plan = os_info.get("power_plan", "") or ""
-    if power_plan and "high performance" not in power_plan.lower() and "ultimate" not in power_plan.lower():
+    if power_plan and "high performance" not in power_plan_lower and "ultimate" not in power_plan_lower:
         issues.append(
             f'Power plan set to "{power_plan}" -- switch to "High Performance" for gaming'
         )
@@ -1170,29 +2037,26 @@ def detect_issues(cpu, gpu, ram, storage, os_info, bios_settings) -> list[str]:
         )
 
     # 4. High CPU temperature
-    cpu_temp = cpu.get("current_temp_c")
     if cpu_temp and cpu_temp > 85:
         issues.append(
             f"CPU temperature is {cpu_temp} C -- this is quite high, check cooling solution"
         )
 
     # 5. High GPU temperature
-    gpu_temp = gpu.get("current_temp_c")
     if gpu_temp and gpu_temp > 85:
         issues.append(
             f"GPU temperature is {gpu_temp} C -- this is high, check case airflow and fan curve"
         )
 
     # 6. Low VRAM
-    vram = gpu.get("vram_total_gb")
     if vram and vram < 4:
         issues.append(
             f"GPU only has {vram}GB VRAM -- modern games may struggle at higher settings"
         )
 
     # 7. Boot drive nearly full
-    for d in storage:
-        if d.get("is_boot_drive") and d.get("capacity_gb") and d.get("free_gb"):
+    for d in boot_drives:
+        if d.get("capacity_gb") and d.get("free_gb"):
             pct_free = (d["free_gb"] / d["capacity_gb"]) * 100
             if pct_free < 10:
                 issues.append(
@@ -1201,8 +2065,8 @@ def detect_issues(cpu, gpu, ram, storage, os_info, bios_settings) -> list[str]:
                 )
 
     # 8. Boot drive is HDD
-    for d in storage:
-        if d.get("is_boot_drive") and d.get("type") == "HDD":
+    for d in boot_drives:
+        if d.get("type") == "HDD":
             issues.append(
                 "Boot drive is a mechanical HDD -- upgrading to an SSD will dramatically improve load times"
             )
@@ -1218,15 +2082,14 @@ def detect_issues(cpu, gpu, ram, storage, os_info, bios_settings) -> list[str]:
         )
 
     # 11. High RAM usage
-    if ram.get("usage_percent") and ram["usage_percent"] > 90:
+    if ram_usage and ram_usage > 90:
         issues.append(
-            f"RAM usage is at {ram['usage_percent']}% -- consider closing background apps or upgrading RAM"
+            f"RAM usage is at {ram_usage}% -- consider closing background apps or upgrading RAM"
         )
 
     # 12. Resizable BAR disabled with supported GPU
     if bios_settings.get("resizable_bar") is False:
-        gpu_name = (gpu.get("model_name") or "").upper()
-        if any(k in gpu_name for k in ("RTX 30", "RTX 40", "RTX 50", "RX 6", "RX 7")):
+        if _REBAR_GPU_RE.search(gpu_name):
             issues.append(
                 "Resizable BAR (ReBAR/SAM) is disabled -- enable in BIOS for potential FPS gains"
             )
@@ -1238,6 +2101,15 @@ def detect_issues(cpu, gpu, ram, storage, os_info, bios_settings) -> list[str]:
 # Console Summary
 # ---------------------------------------------------------------------------
 
+def _ddr_label(form_factor: str, speed_mhz: int) -> str:
+    """DDR generation from the form factor string, else guessed from speed."""
+    if "DDR5" in form_factor:
+        return "DDR5"
+    if "DDR4" in form_factor:
+        return "DDR4"
+    return "DDR5" if speed_mhz >= _DDR5_MIN_SPEED_MHZ else "DDR4"
+
+
 def print_summary(cpu, gpu, ram, storage, os_info, bios_settings, issues):
     print()
     print("=" * 55)
@@ -1251,7 +2123,8 @@ def print_summary(cpu, gpu, ram, storage, os_info, bios_settings, issues):
     base = cpu.get("base_clock_ghz")
     current = cpu.get("current_clock_ghz")
     temp = cpu.get("current_temp_c")
-    cpu_line = f"  CPU: {cpu.get('model_name', 'Unknown')} ({cores}C/{threads}T"
+    cpu_name = cpu.get("model_name", "Unknown")
+    cpu_line = f"  CPU: {cpu_name} ({cores}C/{threads}T"
     if base:
         cpu_line += f", {base}GHz base"
     if current:
@@ -1267,7 +2140,8 @@ def print_summary(cpu, gpu, ram, storage, os_info, bios_settings, issues):
     gtemp = gpu.get("current_temp_c")
     pcie_gen = gpu.get("pcie_generation")
     pcie_w = gpu.get("pcie_link_width")
-    gpu_line = f"  GPU: {gpu.get('model_name', 'Unknown')}"
+    gpu_name = gpu.get("model_name", "Unknown")
+    gpu_line = f"  GPU: {gpu_name}"
     details = []
     if vram:
         details.append(f"{vram}GB VRAM")
@@ -1285,19 +2159,12 @@ def print_summary(cpu, gpu, ram, storage, os_info, bios_settings, issues):
     total = ram.get("total_gb")
     speed = ram.get("speed_mhz")
     channel = ram.get("channel_mode", "")
+    form = ram.get("form_factor", "")
     xmp = bios_settings.get("xmp_enabled")
     ram_line = f"  RAM: {total}GB" if total else "  RAM: Unknown"
     if speed:
         # Use form_factor for DDR gen if available, else guess from speed
-        form = ram.get("form_factor", "")
-        if "DDR5" in form:
-            ram_line += f" DDR5-{speed}"
-        elif "DDR4" in form:
-            ram_line += f" DDR4-{speed}"
-        elif speed >= 5200:
-            ram_line += f" DDR5-{speed}"
-        else:
-            ram_line += f" DDR4-{speed}"
+        ram_line += f" {_ddr_label(form, speed)}-{speed}"
     channel_str = channel.title() if channel else ""
     if channel_str:
         ram_line += f" ({channel_str} Channel"
@@ -1319,6 +2186,7 @@ def print_summary(cpu, gpu, ram, storage, os_info, bios_settings, issues):
         used = d.get("used_gb")
         health = d.get("health_status")
         iface = d.get("interface", "")
+        is_boot = d.get("is_boot_drive")
 
         s_line = f"  Storage: {model}"
         if cap:
@@ -1335,7 +2203,7 @@ def print_summary(cpu, gpu, ram, storage, os_info, bios_settings, issues):
             details.append(f"{pct}% used")
         if health:
             details.append(health.lower())
-        if d.get("is_boot_drive"):
+        if is_boot:
             details.append("boot")
         if details:
             s_line += f" ({', '.join(details)})"
@@ -1367,12 +2235,12 @@ def print_summary(cpu, gpu, ram, storage, os_info, bios_settings, issues):
 # Upload
 # ---------------------------------------------------------------------------
 
-def upload_scan(data: dict, url: str = "http://localhost:3000/api/scan"):
-    """POST the scan JSON to the given URL."""
+def _post_scan(data: dict, url: str) -> str:
+    """POST the scan JSON and return the status line to print."""
     import urllib.request
     import urllib.error
 
-    payload = json.dumps(data).encode("utf-8")
+    payload = _json_dumps(data, indent=False)
     req = urllib.request.Request(
         url,
         data=payload,
@@ -1383,13 +2251,18 @@ def upload_scan(data: dict, url: str = "http://localhost:3000/api/scan"):
         with urllib.request.urlopen(req, timeout=15) as resp:
             status = resp.status
             body = resp.read().decode("utf-8", errors="replace")
-            print(f"[UPLOAD] Success ({status}): {body[:200]}")
+            return f"[UPLOAD] Success ({status}): {body[:200]}"
     except urllib.error.HTTPError as e:
-        print(f"[UPLOAD] HTTP Error {e.code}: {e.reason}")
+        return f"[UPLOAD] HTTP Error {e.code}: {e.reason}"
     except urllib.error.URLError as e:
-        print(f"[UPLOAD] Connection failed: {e.reason}")
+        return f"[UPLOAD] Connection failed: {e.reason}"
     except Exception as e:
-        print(f"[UPLOAD] Error: {e}")
+        return f"[UPLOAD] Error: {e}"
+
+
+def upload_scan(data: dict, url: str = "http://localhost:3000/api/scan"):
+    """POST the scan JSON to the given URL."""
+    print(_post_scan(data, url))
 
 
 # ---------------------------------------------------------------------------
@@ -1403,14 +2276,18 @@ def quick_snapshot(base_scan: dict) -> dict:
     slow WMI/cpuinfo/detection calls. Returns a full scan-shaped object
     so the dashboard API accepts it without changes.
     """
-    snap = json.loads(json.dumps(base_scan))  # deep copy
+    psutil = _get_psutil()
+    GPUtil = _get_gputil()
+    _clear_command_cache()
+    snap = _json_loads(_json_dumps(base_scan, indent=False))  # deep copy
     snap["timestamp"] = datetime.now(timezone.utc).isoformat()
     snap["scan_id"] = f"monitor-{int(time.time())}"
 
     # --- CPU live metrics ---
     if psutil:
         try:
-            per_core = psutil.cpu_percent(interval=0.3, percpu=True)
+            # Non-blocking: measured since the previous snapshot / full scan
+            per_core = psutil.cpu_percent(percpu=True)
             snap["cpu"]["usage_per_core"] = [round(c, 1) for c in per_core]
         except Exception:
             pass
@@ -1421,9 +2298,9 @@ def quick_snapshot(base_scan: dict) -> dict:
                 snap["cpu"]["current_clock_ghz"] = round(freq.current / 1000, 2)
         except Exception:
             pass
-        # CPU temp
+        # CPU temp (psutil has no sensor support on Windows)
         try:
-            temps = psutil.sensors_temperatures()
+            temps = psutil.sensors_temperatures() if sys.platform != "win32" else {}
             for name in ("coretemp", "k10temp", "zenpower", "cpu_thermal"):
                 if name in temps and temps[name]:
                     snap["cpu"]["current_temp_c"] = round(temps[name][0].current, 1)
@@ -1438,48 +2315,77 @@ def quick_snapshot(base_scan: dict) -> dict:
         except Exception:
             pass
 
-    # --- GPU live metrics ---
-    if GPUtil:
+    # --- Sensor daemon: one shared-memory read replaces the queries below ---
+    live = _sensor_snapshot()
+    if live:
+        if live["cpu_temp_c"] is not None:
+            snap["cpu"]["current_temp_c"] = round(live["cpu_temp_c"], 1)
+        if live["cpu_power_w"] is not None:
+            snap["cpu"]["power_draw_w"] = live["cpu_power_w"]
+        for key, gpu_key in _SENSOR_GPU_FIELDS:
+            if live[key] is not None:
+                snap["gpu"][gpu_key] = live[key]
+        return snap
+
+    # --- GPU live metrics: NVML in-process, else GPUtil / nvidia-smi ---
+    nvml_live = _read_gpu_live()
+    if nvml_live:
+        for gpu_key, value in nvml_live.items():
+            if value is not None:
+                snap["gpu"][gpu_key] = round(value, 2 if gpu_key == "vram_used_gb" else 1)
+    else:
+        if GPUtil:
+            try:
+                gpus = GPUtil.getGPUs()
+                if gpus:
+                    g = gpus[0]
+                    snap["gpu"]["current_temp_c"] = round(g.temperature, 1) if g.temperature else None
+                    snap["gpu"]["gpu_utilization_pct"] = round(g.load * 100, 1) if g.load is not None else 0
+                    snap["gpu"]["vram_used_gb"] = round(g.memoryUsed / 1024, 2) if g.memoryUsed else 0
+                    snap["gpu"]["gpu_clock_mhz"] = 0  # GPUtil doesn't provide clocks directly
+            except Exception:
+                pass
+
+        # nvidia-smi fallback when the NVML binding is not installed
         try:
-            gpus = GPUtil.getGPUs()
-            if gpus:
-                g = gpus[0]
-                snap["gpu"]["current_temp_c"] = round(g.temperature, 1) if g.temperature else None
-                snap["gpu"]["gpu_utilization_pct"] = round(g.load * 100, 1) if g.load is not None else 0
-                snap["gpu"]["vram_used_gb"] = round(g.memoryUsed / 1024, 2) if g.memoryUsed else 0
-                snap["gpu"]["gpu_clock_mhz"] = 0  # GPUtil doesn't provide clocks directly
+            smi = _run_cmd(
+                'nvidia-smi --query-gpu=temperature.gpu,utilization.gpu,memory.used,clocks.current.graphics '
+                '--format=csv,noheader,nounits',
+                timeout=5,
+            )
+            if smi:
+                parts = [p.strip() for p in smi.split(",")]
+                if len(parts) >= 4:
+                    t = _safe_float(parts[0])
+                    if t is not None:
+                        snap["gpu"]["current_temp_c"] = round(t, 1)
+                    u = _safe_float(parts[1])
+                    if u is not None:
+                        snap["gpu"]["gpu_utilization_pct"] = round(u, 1)
+                    m = _safe_float(parts[2])
+                    if m is not None:
+                        snap["gpu"]["vram_used_gb"] = round(m / 1024, 2)
+                    c = _safe_float(parts[3])
+                    if c is not None:
+                        snap["gpu"]["gpu_clock_mhz"] = round(c)
         except Exception:
             pass
 
-    # Try nvidia-smi for clock and more accurate data
-    try:
-        smi = _run_cmd(
-            'nvidia-smi --query-gpu=temperature.gpu,utilization.gpu,memory.used,clocks.current.graphics '
-            '--format=csv,noheader,nounits',
-            timeout=5,
-        )
-        if smi:
-            parts = [p.strip() for p in smi.split(",")]
-            if len(parts) >= 4:
-                t = _safe_float(parts[0])
-                if t is not None:
-                    snap["gpu"]["current_temp_c"] = round(t, 1)
-                u = _safe_float(parts[1])
-                if u is not None:
-                    snap["gpu"]["gpu_utilization_pct"] = round(u, 1)
-                m = _safe_float(parts[2])
-                if m is not None:
-                    snap["gpu"]["vram_used_gb"] = round(m / 1024, 2)
-                c = _safe_float(parts[3])
-                if c is not None:
-                    snap["gpu"]["gpu_clock_mhz"] = round(c)
-    except Exception:
-        pass
-
     return snap
 
 
 def main():
+    try:
+        _main()
+    finally:
+        # Never leave the hosted PowerShell behind (errors / Ctrl+C included)
+        _PS_SESSION.close()
+
+
+def _main():
+    # CLI-only module; keep it off the import path for library users
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="PC Bottleneck Analyzer - System Scanner"
     )
@@ -1524,34 +2430,62 @@ def main():
         format="[%(levelname)s] %(message)s",
     )
 
-    print("Scanning system hardware... please wait.\n")
-    start = time.time()
-
-    scan_id = str(uuid.uuid4())
-    timestamp = datetime.now(timezone.utc).isoformat()
-
-    # --- Run all scans ---
-    print("  [1/7] Scanning CPU...")
-    cpu = scan_cpu()
+    # Join COM only once we know we are scanning (not for --help / bad args)
+    pythoncom = _com_initialize()
+    try:
+        _run(args)
+    finally:
+        if pythoncom is not None:
+            _com_uninitialize(pythoncom)
 
-    print("  [2/7] Scanning GPU...")
-    gpu = scan_gpu()
 
-    print("  [3/7] Scanning RAM...")
-    ram = scan_ram()
+def _run(args):
+    """Full scan, save / print / upload, then the optional monitor loop."""
+    import uuid
 
-    print("  [4/7] Scanning storage...")
-    storage = scan_storage()
+    print("Scanning system hardware... please wait.\n")
+    start = time.time()
 
-    print("  [5/7] Scanning motherboard...")
-    motherboard = scan_motherboard()
+    # Load the optional libraries on the main thread before fanning out:
+    # psutil primes its CPU counters (COM was already joined in _main()).
+    _get_psutil()
+    _get_nvml()
 
-    print("  [6/7] Scanning OS settings...")
-    os_info = scan_os()
+    _clear_command_cache()
+    scan_id = str(uuid.uuid4())
+    timestamp = datetime.now(timezone.utc).isoformat()
 
-    print("  [7/7] Scanning network & BIOS settings...")
-    network = scan_network()
-    bios_settings = scan_bios_settings(ram)
+    # --- Run all scans concurrently ---
+    # Each scan blocks on WMI / subprocess / ping I/O rather than the GIL, so
+    # total latency becomes the slowest scan instead of the sum of all of them.
+    scans = (
+        ("cpu", "CPU", scan_cpu),
+        ("gpu", "GPU", scan_gpu),
+        ("ram", "RAM", scan_ram),
+        ("storage", "storage", scan_storage),
+        ("motherboard", "motherboard", scan_motherboard),
+        ("os", "OS settings", scan_os),
+        ("network", "network", scan_network),
+    )
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(scans) + 1) as ex:
+        futures = {ex.submit(fn): (key, label) for key, label, fn in scans}
+        ram_future = next(f for f, (key, _) in futures.items() if key == "ram")
+        # BIOS heuristics need the RAM result: chain it onto that future
+        bios_future = ex.submit(lambda: scan_bios_settings(ram_future.result()))
+        futures[bios_future] = ("bios_settings", "BIOS settings")
+        for done, fut in enumerate(as_completed(futures), 1):
+            key, label = futures[fut]
+            results[key] = fut.result()
+            print(f"  [{done}/{len(futures)}] Scanned {label}")
+    cpu = results["cpu"]
+    gpu = results["gpu"]
+    ram = results["ram"]
+    storage = results["storage"]
+    motherboard = results["motherboard"]
+    os_info = results["os"]
+    network = results["network"]
+    bios_settings = results["bios_settings"]
 
     duration = round(time.time() - start, 2)
 
@@ -1574,10 +2508,17 @@ def main():
         "issues": issues,
     }
 
+    # --- Start the upload so the POST overlaps saving and printing ---
+    upload_future = None
+    if args.upload or args.monitor:
+        upload_pool = ThreadPoolExecutor(max_workers=1)
+        upload_future = upload_pool.submit(_post_scan, result, args.upload_url)
+        upload_pool.shutdown(wait=False)
+
     # --- Save JSON ---
     try:
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(args.output, "wb") as f:
+            f.write(_json_dumps(result))
         print(f"\nScan saved to: {os.path.abspath(args.output)}")
     except Exception as e:
         print(f"\n[ERROR] Failed to save JSON: {e}")
@@ -1589,9 +2530,9 @@ def main():
     print()
 
     # --- Upload if requested ---
-    if args.upload or args.monitor:
+    if upload_future is not None:
         print("Uploading scan results...")
-        upload_scan(result, url=args.upload_url)
+        print(upload_future.result())
 
     # --- Monitor mode ---
     if args.monitor:
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+PC Bottleneck Analyzer - Sensor Daemon
+======================================
+Polls the live sensors (CPU temperature and power, NVIDIA GPU counters) in
+the background and publishes the latest readings to a shared-memory block.
+While it runs, scanner.py and --monitor read that block instead of querying
+WMI / NVML on every scan.
+
+Usage:
+    python sensor_daemon.py                 # Poll once per second until Ctrl+C
+    python sensor_daemon.py --interval 0.5  # Poll every 0.5 s
+
+Readings older than a few seconds are ignored by the scanner, so stopping
+the daemon simply falls back to direct queries.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from multiprocessing import shared_memory
+
+from scanner import (
+    _SENSOR_FIELDS,
+    _SENSOR_SHM_NAME,
+    _SENSOR_SHM_SIZE,
+    _SENSOR_STRUCT,
+    _get_nvml,
+    _get_psutil,
+    _get_wmi_module,
+    _read_cpu_power,
+    _read_cpu_temp,
+    _read_gpu_live,
+)
+
+_NAN = float("nan")
+
+
+def sample() -> tuple[float, ...]:
+    """Read every sensor once, in _SENSOR_FIELDS order (NaN = unavailable)."""
+    readings = {
+        "cpu_temp_c": _read_cpu_temp(),
+        "cpu_power_w": _read_cpu_power(),
+    }
+    gpu = _read_gpu_live()
+    if gpu:
+        readings["gpu_temp_c"] = gpu["current_temp_c"]
+        readings["gpu_utilization_pct"] = gpu["gpu_utilization_pct"]
+        readings["gpu_clock_mhz"] = gpu["gpu_clock_mhz"]
+        readings["memory_clock_mhz"] = gpu["memory_clock_mhz"]
+        readings["vram_used_gb"] = gpu["vram_used_gb"]
+    return tuple(
+        _NAN if readings.get(k) is None else float(readings[k]) for k in _SENSOR_FIELDS
+    )
+
+
+def publish(buf, seq: int, values: tuple[float, ...]) -> int:
+    """Write one snapshot under the seqlock; returns the next sequence number."""
+    # Odd counter first so readers retry instead of seeing a half-written block
+    _SENSOR_STRUCT.pack_into(buf, 0, seq + 1, time.time(), *values)
+    _SENSOR_STRUCT.pack_into(buf, 0, seq + 2, time.time(), *values)
+    return seq + 2
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="PC Bottleneck Analyzer - Sensor Daemon"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between sensor polls (default: 1.0)",
+    )
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable debug logging",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="[%(levelname)s] %(message)s",
+    )
+
+    # Same apartment / library setup the scanner does before it queries WMI
+    _get_psutil()
+    _get_wmi_module()
+    _get_nvml()
+
+    try:
+        shm = shared_memory.SharedMemory(name=_SENSOR_SHM_NAME, create=True, size=_SENSOR_SHM_SIZE)
+    except FileExistsError:
+        print(f"[ERROR] Shared memory '{_SENSOR_SHM_NAME}' already exists — is another daemon running?")
+        sys.exit(1)
+
+    print(f"[OK] Publishing sensor readings every {args.interval}s to '{_SENSOR_SHM_NAME}'. Press Ctrl+C to stop.")
+    seq = 0
+    try:
+        while True:
+            started = time.monotonic()
+            seq = publish(shm.buf, seq, sample())
+            time.sleep(max(0.0, args.interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        print("\n[OK] Sensor daemon stopped.")
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    main()